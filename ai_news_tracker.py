@@ -8,10 +8,73 @@ import feedparser
 import requests
 import json
 import csv
+import hashlib
+import heapq
+import html
+import pickle
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import re
 from collections import Counter
+from itertools import chain
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+try:
+    import feedparser_rs  # optional Rust parser, much faster than feedparser
+except ImportError:
+    feedparser_rs = None
+
+try:
+    import ahocorasick  # optional C automaton for keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional Rust JSON serializer
+except ImportError:
+    orjson = None
+
+
+def build_keyword_automaton(keywords: List[str]):
+    """Compile lowercase keywords into one Aho-Corasick automaton (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
+class Article:
+    """A scraped article; exported fields are declared in JSON/CSV column order"""
+    title: str
+    link: str
+    published_date: str
+    author: str
+    summary: str
+    feed_name: str
+    feed_url: str
+    tags: str
+    companies_mentioned: str
+    ai_relevance_score: int
+    is_ai_related: bool
+    
+    # Internal, not exported
+    companies: List[str] = field(default_factory=list, metadata={'export': False})
+    published: Optional[datetime] = field(default=None, metadata={'export': False})
+    
+    def to_dict(self) -> Dict:
+        """Exported fields as a plain dict"""
+        return {name: getattr(self, name) for name in EXPORT_FIELDS}
+
+
+EXPORT_FIELDS = tuple(f.name for f in fields(Article) if f.metadata.get('export', True))
 
 
 class AINewsTracker:
@@ -29,98 +92,288 @@ class AINewsTracker:
         'ai model', 'ai startup', 'ai funding', 'ai regulation', 'ai ethics',
         'autonomous', 'robotics ai', 'ai chip', 'gpu', 'nvidia ai', 'ai training'
     ]
+    _AI_AUTOMATON = build_keyword_automaton(AI_KEYWORDS)
     
-    def __init__(self, user_agent: str = "AI-News-Tracker/1.0"):
+    # AI companies to look for in article text
+    AI_COMPANIES = [
+        'OpenAI', 'Anthropic', 'Google', 'DeepMind', 'Microsoft', 'Meta',
+        'Amazon', 'Apple', 'Tesla', 'NVIDIA', 'Stability AI', 'Midjourney',
+        'Cohere', 'Hugging Face', 'Scale AI', 'Character.AI', 'Inflection AI',
+        'Adept', 'AI21 Labs', 'Jasper', 'Runway', 'Replicate', 'Together AI',
+        'Databricks', 'Snowflake', 'C3.ai', 'UiPath', 'Palantir'
+    ]
+    # One alternation, longest names first, instead of a search per company.
+    # Each name is its own group, so m.lastindex maps a match back to the name even
+    # when IGNORECASE matched a case-folded spelling ('Mıcrosoft', 'Databrickſ').
+    _COMPANY_ORDER = sorted(AI_COMPANIES, key=len, reverse=True)
+    _COMPANY_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(c) + ')' for c in _COMPANY_ORDER) + r')\b',
+        re.IGNORECASE)
+    
+    # Fields copied out of feedparser-rs results (everything the tracker reads)
+    FEED_FIELDS = ('title', 'link', 'subtitle')
+    ENTRY_FIELDS = ('title', 'link', 'author', 'summary', 'published_parsed', 'updated_parsed')
+    
+    # Sort key for ranking articles
+    _SCORE_KEY = attrgetter('ai_relevance_score')
+    
+    # Parsed feeds kept on disk, keyed by a hash of the raw feed bytes
+    PARSE_CACHE_SIZE = 256
+    
+    def __init__(self, user_agent: str = "AI-News-Tracker/1.0", max_workers: int = 32,
+                 cache_dir: Optional[str] = '.feed_cache'):
         self.user_agent = user_agent
-        self.all_articles = []
+        self.max_workers = max_workers
+        self.total_articles = 0
         self.ai_articles = []
+        self._sorted_articles = None
+        
+        # One keep-alive session shared by all fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Conditional GET cache: feed URL -> {'etag', 'modified', 'digest'}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.feed_cache = self._load_feed_cache()
+    
+    def _load_feed_cache(self) -> Dict:
+        """Load the ETag/Last-Modified index saved by the previous run"""
+        if not self.cache_dir:
+            return {}
+        try:
+            with open(self.cache_dir / 'index.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_feed_cache(self):
+        """Persist the ETag/Last-Modified index and evict least recently used parses"""
+        if not self.cache_dir:
+            return
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self.cache_dir / 'index.json', 'w', encoding='utf-8') as f:
+            json.dump(self.feed_cache, f, indent=2)
+        
+        parsed = sorted(self.cache_dir.glob('*.pickle'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in parsed[self.PARSE_CACHE_SIZE:]:
+            path.unlink(missing_ok=True)
+    
+    def _parsed_feed_path(self, digest: str) -> Path:
+        """Location of the pickled parse result for feed content with this digest"""
+        return self.cache_dir / f'{digest}.pickle'
+    
+    def _load_parsed_feed(self, digest: Optional[str]) -> Optional[feedparser.FeedParserDict]:
+        """Load a cached parse result, marking it as recently used"""
+        if not digest:
+            return None
+        path = self._parsed_feed_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                feed = pickle.load(f)
+        except OSError:
+            return None
+        except Exception:
+            # Truncated or stale pickle (e.g. written by another feedparser version); drop it and re-parse
+            path.unlink(missing_ok=True)
+            return None
+        path.touch()
+        return feed
+    
+    def parse_feed(self, content: bytes) -> feedparser.FeedParserDict:
+        """Parse raw feed bytes, using feedparser-rs when it is installed"""
+        if feedparser_rs is None:
+            return feedparser.parse(content)
+        
+        parsed = feedparser_rs.parse(content)
+        feed = feedparser.FeedParserDict(
+            bozo=parsed.bozo,
+            feed=self._to_feedparser_dict(parsed.feed, self.FEED_FIELDS),
+            entries=[self._to_feedparser_dict(entry, self.ENTRY_FIELDS)
+                     for entry in parsed.entries]
+        )
+        if parsed.bozo:
+            feed['bozo_exception'] = parsed.bozo_exception
+        return feed
+    
+    @staticmethod
+    def _to_feedparser_dict(item, keys) -> feedparser.FeedParserDict:
+        """Copy feedparser-rs fields into a FeedParserDict, leaving unset ones missing"""
+        data = feedparser.FeedParserDict()
+        for key in keys:
+            value = item.get(key)
+            if value is None:
+                continue
+            # feedparser-rs keeps plain-text titles entity-escaped; feedparser decodes them
+            if key == 'title' and '<' not in value:
+                value = html.unescape(value)
+            data[key] = value
+        
+        tags = getattr(item, 'tags', None)
+        if tags:
+            # feedparser drops repeated categories, feedparser-rs keeps them
+            terms = dict.fromkeys(tag.term for tag in tags)
+            data['tags'] = [feedparser.FeedParserDict(term=term) for term in terms]
+        return data
+    
+    def _parse_with_cache(self, content: bytes):
+        """Parse feed bytes, reusing the cached parse of byte-identical content"""
+        if not self.cache_dir:
+            return None, self.parse_feed(content)
+        
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        feed = self._load_parsed_feed(digest)
+        if feed is None:
+            feed = self.parse_feed(content)
+            if not self._store_parsed_feed(digest, feed):
+                return None, feed
+        return digest, feed
+    
+    def _store_parsed_feed(self, digest: str, feed: feedparser.FeedParserDict) -> bool:
+        """Pickle a parse result for reuse; returns False if it cannot be pickled"""
+        try:
+            data = pickle.dumps(feed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, ValueError, AttributeError):
+            # e.g. the SAXParseException feedparser attaches to malformed feeds
+            return False
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self._parsed_feed_path(digest), 'wb') as f:
+            f.write(data)
+        return True
     
     def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
-        """Fetch and parse an RSS feed"""
+        """Fetch and parse an RSS feed, skipping the download if it is unchanged"""
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=15)
+            cached = self.feed_cache.get(feed_url) if self.cache_dir else None
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('modified'):
+                    headers['If-Modified-Since'] = cached['modified']
+            
+            response = self.session.get(feed_url, headers=headers, timeout=15)
+            if response.status_code == 304:
+                feed = self._load_parsed_feed(cached.get('digest') if cached else None)
+                if feed is not None:
+                    return feed
+                # Cached copy is gone, fall back to a full download
+                response = self.session.get(feed_url, headers={'User-Agent': self.user_agent},
+                                            timeout=15)
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
+            digest, feed = self._parse_with_cache(response.content)
+            
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
+            if digest and (etag or modified):
+                self.feed_cache[feed_url] = {'etag': etag, 'modified': modified, 'digest': digest}
+            
             return feed
         except Exception as e:
             print(f"Error fetching {feed_url}: {e}")
             return None
     
+    def match_ai_keywords(self, text_lower: str) -> set:
+        """Return the distinct AI keywords found in lowercased text, in a single scan"""
+        if self._AI_AUTOMATON is not None:
+            return {keyword for _, keyword in self._AI_AUTOMATON.iter(text_lower)}
+        return {keyword for keyword in self.AI_KEYWORDS if keyword in text_lower}
+    
     def is_ai_related(self, text: str) -> bool:
         """Check if text contains AI-related keywords"""
         text_lower = text.lower()
+        if self._AI_AUTOMATON is not None:
+            return next(self._AI_AUTOMATON.iter(text_lower), None) is not None
         return any(keyword in text_lower for keyword in self.AI_KEYWORDS)
     
-    def calculate_ai_relevance_score(self, entry: Dict) -> int:
-        """Calculate how relevant an article is to AI (0-100)"""
+    def calculate_ai_relevance_score(self, title_lower: str, summary: str) -> int:
+        """
+        Calculate how relevant an article is to AI (0-100)
+        
+        Args:
+            title_lower: Lowercased article title
+            summary: Article summary (lowercased here only if the title is not decisive)
+        """
         score = 0
-        text_to_check = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
+        
+        # Six distinct keywords in the title alone max out every component below,
+        # so the (much longer) summary never needs to be lowercased or scanned
+        title_keywords = self.match_ai_keywords(title_lower)
+        if len(title_keywords) >= 6:
+            return 100
         
         # Count keyword matches
-        keyword_matches = sum(1 for keyword in self.AI_KEYWORDS if keyword in text_to_check)
-        score += min(keyword_matches * 10, 60)  # Max 60 points for keywords
+        keyword_matches = len(self.match_ai_keywords(f"{title_lower} {summary.lower()}"))
+        score += keyword_matches * 10 if keyword_matches < 6 else 60  # Max 60 points for keywords
         
         # Bonus for AI in title
-        if self.is_ai_related(entry.get('title', '')):
+        if title_keywords:
             score += 20
         
         # Bonus for multiple AI keyword mentions
         if keyword_matches >= 3:
             score += 20
         
-        return min(score, 100)
+        # 60 + 20 + 20 tops out at 100, so no final clamp is needed
+        return score
     
-    def extract_entry_data(self, entry, feed_name: str, feed_url: str) -> Dict:
-        """Extract data from a feed entry"""
-        # Get published date
-        published_date = 'Unknown'
+    def get_published_date(self, entry) -> Optional[datetime]:
+        """Published (or updated) date of a feed entry, if it has one"""
         if 'published_parsed' in entry and entry.published_parsed:
-            published_date = datetime(*entry.published_parsed[:6]).isoformat()
+            return datetime(*entry.published_parsed[:6])
         elif 'updated_parsed' in entry and entry.updated_parsed:
-            published_date = datetime(*entry.updated_parsed[:6]).isoformat()
+            return datetime(*entry.updated_parsed[:6])
+        return None
+    
+    def extract_entry_data(self, entry, feed_name: str, feed_url: str,
+                           min_relevance_score: int = 0,
+                           published: Optional[datetime] = None) -> Optional[Article]:
+        """
+        Extract data from a feed entry
+        
+        Scores the entry first and returns None if it falls below
+        min_relevance_score, before any other field is extracted.
+        A published date already read by the caller can be passed in.
+        """
+        # Calculate AI relevance
+        title = entry.get('title', 'N/A')
+        summary = entry.get('summary', entry.get('description', 'N/A'))
+        score = self.calculate_ai_relevance_score(title.lower(), summary)
+        if score < min_relevance_score:
+            return None
+        
+        # Get published date
+        if published is None:
+            published = self.get_published_date(entry)
         
         # Extract companies mentioned
         summary_text = entry.get('summary', '') + ' ' + entry.get('title', '')
         companies = self.extract_companies(summary_text)
         
-        entry_data = {
-            'title': entry.get('title', 'N/A'),
-            'link': entry.get('link', 'N/A'),
-            'published_date': published_date,
-            'author': entry.get('author', 'N/A'),
-            'summary': entry.get('summary', entry.get('description', 'N/A')),
-            'feed_name': feed_name,
-            'feed_url': feed_url,
-            'tags': ', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A',
-            'companies_mentioned': ', '.join(companies) if companies else 'N/A'
-        }
-        
-        # Calculate AI relevance
-        entry_data['ai_relevance_score'] = self.calculate_ai_relevance_score(entry_data)
-        entry_data['is_ai_related'] = entry_data['ai_relevance_score'] >= 30
-        
-        return entry_data
+        return Article(
+            title=title,
+            link=entry.get('link', 'N/A'),
+            published_date=published.isoformat() if published else 'Unknown',
+            author=entry.get('author', 'N/A'),
+            summary=summary,
+            feed_name=feed_name,
+            feed_url=feed_url,
+            tags=', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A',
+            companies_mentioned=', '.join(companies) if companies else 'N/A',
+            ai_relevance_score=score,
+            is_ai_related=score >= 30,
+            companies=companies,
+            published=published
+        )
     
     def extract_companies(self, text: str) -> List[str]:
         """Extract mentioned AI companies from text"""
-        ai_companies = [
-            'OpenAI', 'Anthropic', 'Google', 'DeepMind', 'Microsoft', 'Meta',
-            'Amazon', 'Apple', 'Tesla', 'NVIDIA', 'Stability AI', 'Midjourney',
-            'Cohere', 'Hugging Face', 'Scale AI', 'Character.AI', 'Inflection AI',
-            'Adept', 'AI21 Labs', 'Jasper', 'Runway', 'Replicate', 'Together AI',
-            'Databricks', 'Snowflake', 'C3.ai', 'UiPath', 'Palantir'
-        ]
-        
-        found_companies = []
-        for company in ai_companies:
-            if re.search(r'\b' + re.escape(company) + r'\b', text, re.IGNORECASE):
-                found_companies.append(company)
-        
-        return found_companies
+        found = {self._COMPANY_ORDER[m.lastindex - 1] for m in self._COMPANY_RE.finditer(text)}
+        return [company for company in self.AI_COMPANIES if company in found]
     
     def scrape_ai_news(self, feed_urls: List[str], days_back: int = 7, 
-                       min_relevance_score: int = 30) -> List[Dict]:
+                       min_relevance_score: int = 30) -> List[Article]:
         """
         Scrape AI news from multiple feeds
         
@@ -128,6 +381,9 @@ class AINewsTracker:
             feed_urls: List of RSS feed URLs
             days_back: Only get articles from last N days
             min_relevance_score: Minimum AI relevance score (0-100)
+        
+        Returns:
+            Matching articles in feed order; use top_articles() for ranking
         """
         cutoff_date = datetime.now() - timedelta(days=days_back)
         
@@ -135,37 +391,54 @@ class AINewsTracker:
         print(f"📅 Looking for articles from the last {days_back} days")
         print(f"🎯 Minimum relevance score: {min_relevance_score}/100\n")
         
-        for feed_url in feed_urls:
-            feed = self.fetch_feed(feed_url)
-            if not feed:
-                continue
-            
-            feed_name = feed.feed.get('title', 'Unknown Feed')
-            print(f"📰 Processing: {feed_name}")
-            
-            for entry in feed.entries:
-                entry_data = self.extract_entry_data(entry, feed_name, feed_url)
-                self.all_articles.append(entry_data)
+        # Fetch all feeds concurrently; map() yields them back in input order
+        workers = max(1, min(self.max_workers, len(feed_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for feed_url, feed in zip(feed_urls, executor.map(self.fetch_feed, feed_urls)):
+                if not feed:
+                    continue
                 
-                # Filter by date
-                if entry_data['published_date'] != 'Unknown':
-                    try:
-                        pub_date = datetime.fromisoformat(entry_data['published_date'])
-                        if pub_date < cutoff_date:
-                            continue
-                    except:
-                        pass
+                feed_name = feed.feed.get('title', 'Unknown Feed')
+                print(f"📰 Processing: {feed_name}")
                 
-                # Filter by AI relevance
-                if entry_data['ai_relevance_score'] >= min_relevance_score:
-                    self.ai_articles.append(entry_data)
+                for entry in feed.entries:
+                    self.total_articles += 1
+                    
+                    # Filter by date before spending any time on scoring
+                    published = self.get_published_date(entry)
+                    if published and published < cutoff_date:
+                        continue
+                    
+                    # Below-threshold entries come back as None without being fully extracted
+                    entry_data = self.extract_entry_data(entry, feed_name, feed_url,
+                                                         min_relevance_score, published)
+                    if entry_data is not None:
+                        self.ai_articles.append(entry_data)
         
-        # Sort by relevance score (highest first)
-        self.ai_articles.sort(key=lambda x: x['ai_relevance_score'], reverse=True)
+        # The list was extended in place, so any cached ranking is stale
+        self._sorted_articles = None
+        self._save_feed_cache()
         
-        print(f"\n✅ Found {len(self.ai_articles)} AI-related articles (out of {len(self.all_articles)} total)")
+        print(f"\n✅ Found {len(self.ai_articles)} AI-related articles (out of {self.total_articles} total)")
         return self.ai_articles
     
+    def top_articles(self, n: Optional[int] = None) -> List[Article]:
+        """
+        Return articles by relevance score (highest first)
+        
+        The full ranking is sorted once and cached per article list, so the
+        JSON and CSV exports share it. With n and no cached ranking, only the
+        top n are selected via a heap instead of sorting everything.
+        """
+        cached = self._sorted_articles
+        if cached is not None and cached[0] is self.ai_articles:
+            return cached[1] if n is None else cached[1][:n]
+        if n is not None:
+            return heapq.nlargest(n, self.ai_articles, key=self._SCORE_KEY)
+        ranked = sorted(self.ai_articles, key=self._SCORE_KEY, reverse=True)
+        self._sorted_articles = (self.ai_articles, ranked)
+        return ranked
+    
     def display_summary(self):
         """Display summary of AI news found"""
         if not self.ai_articles:
@@ -178,12 +451,12 @@ class AINewsTracker:
         
         # Top articles
         print(f"\n📊 Top 10 AI Articles (by relevance):\n")
-        for i, article in enumerate(self.ai_articles[:10], 1):
-            print(f"{i}. [{article['ai_relevance_score']}/100] {article['title']}")
-            print(f"   📅 {article['published_date'][:10]} | 🏢 {article['feed_name']}")
-            print(f"   🔗 {article['link']}")
-            if article['companies_mentioned'] != 'N/A':
-                print(f"   🏭 Companies: {article['companies_mentioned']}")
+        for i, article in enumerate(self.top_articles(10), 1):
+            print(f"{i}. [{article.ai_relevance_score}/100] {article.title}")
+            print(f"   📅 {article.published_date[:10]} | 🏢 {article.feed_name}")
+            print(f"   🔗 {article.link}")
+            if article.companies_mentioned != 'N/A':
+                print(f"   🏭 Companies: {article.companies_mentioned}")
             print()
         
         # Statistics
@@ -192,19 +465,16 @@ class AINewsTracker:
         print("="*80)
         
         # Company mentions
-        all_companies = []
-        for article in self.ai_articles:
-            if article['companies_mentioned'] != 'N/A':
-                all_companies.extend(article['companies_mentioned'].split(', '))
+        company_counts = Counter(chain.from_iterable(
+            article.companies for article in self.ai_articles))
         
-        if all_companies:
-            company_counts = Counter(all_companies)
+        if company_counts:
             print("\n🏢 Most Mentioned Companies:")
             for company, count in company_counts.most_common(10):
                 print(f"   {company}: {count} mentions")
         
         # Feed statistics
-        feed_counts = Counter(article['feed_name'] for article in self.ai_articles)
+        feed_counts = Counter(article.feed_name for article in self.ai_articles)
         print("\n📰 Articles by Source:")
         for feed, count in feed_counts.most_common():
             print(f"   {feed}: {count} articles")
@@ -216,11 +486,16 @@ class AINewsTracker:
         data = {
             'generated_at': datetime.now().isoformat(),
             'total_articles': len(self.ai_articles),
-            'articles': self.ai_articles
+            'articles': [article.to_dict() for article in self.top_articles()]
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"📄 Exported {len(self.ai_articles)} articles to {filename}")
     
     def export_to_csv(self, filename: str = "ai_news.csv"):
@@ -229,17 +504,34 @@ class AINewsTracker:
             print("No articles to export")
             return
         
-        keys = self.ai_articles[0].keys()
+        row = attrgetter(*EXPORT_FIELDS)  # pulls one article's fields out as a tuple, in column order
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(self.ai_articles)
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            writer.writerows(map(row, self.top_articles()))
         
         print(f"📊 Exported {len(self.ai_articles)} articles to {filename}")
     
     def export_html_report(self, filename: str = "ai_news_report.html"):
         """Generate an HTML report of AI news"""
-        html = f"""<!DOCTYPE html>
+        # Article block, filled in per article with str.format
+        article_template = """
+    <div class="article">
+        <h2><a href="{link}" target="_blank">{title}</a></h2>
+        <div class="meta">
+            <span class="score">Relevance: {score}/100</span>
+            📅 {date} | 
+            📰 {feed_name}
+            {author}
+        </div>
+        {companies}
+        <div class="summary">{summary}</div>
+    </div>
+"""
+        
+        # Write straight to the file instead of growing one big string
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -307,30 +599,24 @@ class AINewsTracker:
     <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     <p><strong>Total AI Articles:</strong> {len(self.ai_articles)}</p>
     <hr>
-"""
-        
-        for article in self.ai_articles[:50]:  # Top 50 articles
-            html += f"""
-    <div class="article">
-        <h2><a href="{article['link']}" target="_blank">{article['title']}</a></h2>
-        <div class="meta">
-            <span class="score">Relevance: {article['ai_relevance_score']}/100</span>
-            📅 {article['published_date'][:10]} | 
-            📰 {article['feed_name']}
-            {' | ✍️ ' + article['author'] if article['author'] != 'N/A' else ''}
-        </div>
-        {f'<div class="companies">🏢 Companies: {article["companies_mentioned"]}</div>' if article['companies_mentioned'] != 'N/A' else ''}
-        <div class="summary">{article['summary'][:500]}{'...' if len(article['summary']) > 500 else ''}</div>
-    </div>
-"""
-        
-        html += """
+""")
+            
+            for article in self.top_articles(50):
+                f.write(article_template.format(
+                    link=article.link,
+                    title=article.title,
+                    score=article.ai_relevance_score,
+                    date=article.published_date[:10],
+                    feed_name=article.feed_name,
+                    author=' | ✍️ ' + article.author if article.author != 'N/A' else '',
+                    companies=f'<div class="companies">🏢 Companies: {article.companies_mentioned}</div>' if article.companies_mentioned != 'N/A' else '',
+                    summary=article.summary[:500] + ('...' if len(article.summary) > 500 else '')
+                ))
+            
+            f.write("""
 </body>
 </html>
-"""
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+""")
         
         print(f"📱 Generated HTML report: {filename}")
 
@@ -348,24 +634,26 @@ def main():
                        help='Minimum AI relevance score 0-100 (default: 30)')
     parser.add_argument('-o', '--output', choices=['json', 'csv', 'html', 'all'],
                        default='all', help='Output format')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always re-download feeds instead of sending conditional GETs')
     
     args = parser.parse_args()
     
-    # Read feed URLs
+    # Read feed URLs, dropping comments and duplicate feeds
     try:
-        with open(args.feeds_file, 'r') as f:
-            feed_urls = [line.strip() for line in f 
-                        if line.strip() and not line.startswith('#')]
+        lines = Path(args.feeds_file).read_text().splitlines()
     except FileNotFoundError:
         print(f"Error: Feed file '{args.feeds_file}' not found")
         return
+    feed_urls = list(dict.fromkeys(
+        url for url in map(str.strip, lines) if url and not url.startswith('#')))
     
     if not feed_urls:
         print("No feed URLs found in file")
         return
     
     # Create tracker and scrape
-    tracker = AINewsTracker()
+    tracker = AINewsTracker(cache_dir=None if args.no_cache else '.feed_cache')
     tracker.scrape_ai_news(feed_urls, days_back=args.days, 
                           min_relevance_score=args.score)
     
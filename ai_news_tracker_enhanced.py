@@ -8,10 +8,72 @@ import feedparser
 import requests
 import json
 import csv
+import heapq
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import re
 from collections import Counter
+from itertools import islice
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from requests.adapters import HTTPAdapter
+
+try:
+    import ahocorasick  # optional C automaton for keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional Rust JSON serializer
+except ImportError:
+    orjson = None
+
+
+def build_keyword_automaton(keywords: List[str]):
+    """Compile lowercase keywords into one Aho-Corasick automaton (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
+class Article:
+    """A scraped article; exported fields are declared in JSON/CSV column order"""
+    title: str
+    link: str
+    published_date: str
+    author: str
+    summary: str
+    feed_name: str
+    feed_url: str
+    tags: str
+    companies_mentioned: str
+    
+    # Source credibility fields
+    source_tier: int
+    source_type: str
+    source_credibility: str
+    source_multiplier: float
+    
+    # Scoring fields
+    base_score: int
+    final_score: int
+    is_ai_related: bool
+    
+    # Internal, not exported
+    published: Optional[datetime] = field(default=None, metadata={'export': False})
+    
+    def to_dict(self) -> Dict:
+        """Exported fields as a plain dict"""
+        return {name: getattr(self, name) for name in EXPORT_FIELDS}
+
+
+EXPORT_FIELDS = tuple(f.name for f in fields(Article) if f.metadata.get('export', True))
 
 
 class EnhancedAINewsTracker:
@@ -55,6 +117,8 @@ class EnhancedAINewsTracker:
         'Machine Learning Mastery': {'tier': 5, 'multiplier': 1.0, 'type': 'Educational'},
         'Towards Data Science': {'tier': 5, 'multiplier': 1.0, 'type': 'Community'},
     }
+    # (lowercased name, info) pairs, lowered once at class load for source lookups
+    _SOURCE_TIERS_LOWER = [(source.lower(), info) for source, info in SOURCE_TIERS.items()]
     
     # AI-related keywords for filtering
     AI_KEYWORDS = [
@@ -68,28 +132,81 @@ class EnhancedAINewsTracker:
         'ai model', 'ai startup', 'ai funding', 'ai regulation', 'ai ethics',
         'autonomous', 'robotics ai', 'ai chip', 'gpu', 'nvidia ai', 'ai training'
     ]
+    _AI_AUTOMATON = build_keyword_automaton(AI_KEYWORDS)
+    
+    # Largest feed body we are willing to read (guards against runaway responses)
+    MAX_FEED_BYTES = 10 * 1024 * 1024
     
-    def __init__(self, user_agent: str = "Enhanced-AI-News-Tracker/1.0"):
+    # Sort key for ranking articles
+    _SCORE_KEY = attrgetter('final_score')
+    
+    # AI companies to look for in article text
+    AI_COMPANIES = [
+        'OpenAI', 'Anthropic', 'Google', 'DeepMind', 'Microsoft', 'Meta',
+        'Amazon', 'Apple', 'Tesla', 'NVIDIA', 'Stability AI', 'Midjourney',
+        'Cohere', 'Hugging Face', 'Scale AI', 'Character.AI', 'Inflection AI',
+        'Adept', 'AI21 Labs', 'Jasper', 'Runway', 'Replicate', 'Together AI',
+        'Databricks', 'Snowflake', 'C3.ai', 'UiPath', 'Palantir'
+    ]
+    # Single-word names are looked up as whole \w+ tokens (same as matching \bName\b);
+    # names with spaces or dots go through one alternation, longest first. Each of
+    # those is its own group, so m.lastindex maps a match back to the name even when
+    # IGNORECASE matched a case-folded spelling ('Stabılity AI'). Such spellings
+    # ('Mıcrosoft') are not ASCII, so non-ASCII text scans single words the same way.
+    _WORD_RE = re.compile(r'\w+')
+    _COMPANY_WORDS = frozenset(c.lower() for c in AI_COMPANIES if re.fullmatch(r'\w+', c))
+    _COMPANY_WORD_LIST = [c for c in AI_COMPANIES if re.fullmatch(r'\w+', c)]
+    _COMPANY_WORD_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(c) + ')' for c in _COMPANY_WORD_LIST) + r')\b',
+        re.IGNORECASE)
+    _COMPANY_PHRASES = sorted((c for c in AI_COMPANIES if not re.fullmatch(r'\w+', c)),
+                              key=len, reverse=True)
+    _COMPANY_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(c) + ')' for c in _COMPANY_PHRASES) + r')\b',
+        re.IGNORECASE)
+    _COMPANY_NAMES = {company.lower(): company for company in AI_COMPANIES}
+    
+    def __init__(self, user_agent: str = "Enhanced-AI-News-Tracker/1.0", max_workers: int = 32):
         self.user_agent = user_agent
-        self.all_articles = []
+        self.max_workers = max_workers
+        self.total_articles = 0
         self.ai_articles = []
+        self._sorted_articles = None
+        self.source_info_cache = {}
+        
+        # One keep-alive session shared by all fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
         """Fetch and parse an RSS feed"""
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
+            with self.session.get(feed_url, headers=headers, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                content = response.raw.read(self.MAX_FEED_BYTES + 1, decode_content=True)
+            if len(content) > self.MAX_FEED_BYTES:
+                raise ValueError(f"feed exceeds {self.MAX_FEED_BYTES} bytes")
+            feed = feedparser.parse(content)
             return feed
         except Exception as e:
             print(f"⚠️  Error fetching {feed_url}: {e}")
             return None
     
     def get_source_info(self, feed_name: str) -> Dict:
-        """Get source credibility information"""
-        for source, info in self.SOURCE_TIERS.items():
-            if source.lower() in feed_name.lower():
+        """Get source credibility information (memoized per feed name, treat as read-only)"""
+        source_info = self.source_info_cache.get(feed_name)
+        if source_info is None:
+            source_info = self.source_info_cache[feed_name] = self._lookup_source_info(feed_name)
+        return source_info
+    
+    def _lookup_source_info(self, feed_name: str) -> Dict:
+        """Scan SOURCE_TIERS for the first source named in feed_name"""
+        feed_name_lower = feed_name.lower()
+        for source_lower, info in self._SOURCE_TIERS_LOWER:
+            if source_lower in feed_name_lower:
                 return {
                     'tier': info['tier'],
                     'multiplier': info['multiplier'],
@@ -105,22 +222,36 @@ class EnhancedAINewsTracker:
             'credibility': 'Standard'
         }
     
+    def match_ai_keywords(self, text_lower: str) -> set:
+        """Return the distinct AI keywords found in lowercased text, in a single scan"""
+        if self._AI_AUTOMATON is not None:
+            return {keyword for _, keyword in self._AI_AUTOMATON.iter(text_lower)}
+        return {keyword for keyword in self.AI_KEYWORDS if keyword in text_lower}
+    
     def is_ai_related(self, text: str) -> bool:
         """Check if text contains AI-related keywords"""
         text_lower = text.lower()
+        if self._AI_AUTOMATON is not None:
+            return next(self._AI_AUTOMATON.iter(text_lower), None) is not None
         return any(keyword in text_lower for keyword in self.AI_KEYWORDS)
     
-    def calculate_base_ai_score(self, entry: Dict) -> int:
-        """Calculate base AI relevance score before source weighting"""
+    def calculate_base_ai_score(self, title_lower: str, text_to_check: str) -> int:
+        """
+        Calculate base AI relevance score before source weighting
+        
+        Args:
+            title_lower: Lowercased article title
+            text_to_check: Lowercased "title summary" text
+        """
         score = 0
-        text_to_check = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
         
         # Count keyword matches
-        keyword_matches = sum(1 for keyword in self.AI_KEYWORDS if keyword in text_to_check)
+        keywords = self.match_ai_keywords(text_to_check)
+        keyword_matches = len(keywords)
         score += min(keyword_matches * 8, 50)  # Max 50 points for keywords
         
-        # Bonus for AI in title
-        if self.is_ai_related(entry.get('title', '')):
+        # Bonus for AI in title (any title hit is also a hit in the full text)
+        if any(keyword in title_lower for keyword in keywords):
             score += 15
         
         # Bonus for multiple AI keyword mentions
@@ -133,7 +264,8 @@ class EnhancedAINewsTracker:
         if any(kw in text_to_check for kw in impact_keywords):
             score += 10
         
-        return min(score, 100)
+        # 50 + 15 + 15 + 10 tops out at 90, so no final clamp is needed
+        return score
     
     def calculate_weighted_score(self, base_score: int, source_multiplier: float) -> int:
         """Apply source credibility weighting to base score"""
@@ -142,73 +274,75 @@ class EnhancedAINewsTracker:
     
     def extract_companies(self, text: str) -> List[str]:
         """Extract mentioned AI companies from text"""
-        ai_companies = [
-            'OpenAI', 'Anthropic', 'Google', 'DeepMind', 'Microsoft', 'Meta',
-            'Amazon', 'Apple', 'Tesla', 'NVIDIA', 'Stability AI', 'Midjourney',
-            'Cohere', 'Hugging Face', 'Scale AI', 'Character.AI', 'Inflection AI',
-            'Adept', 'AI21 Labs', 'Jasper', 'Runway', 'Replicate', 'Together AI',
-            'Databricks', 'Snowflake', 'C3.ai', 'UiPath', 'Palantir'
-        ]
-        
-        found_companies = []
-        for company in ai_companies:
-            if re.search(r'\b' + re.escape(company) + r'\b', text, re.IGNORECASE):
-                found_companies.append(company)
-        
-        return found_companies
-    
-    def extract_entry_data(self, entry, feed_name: str, feed_url: str) -> Dict:
-        """Extract data from a feed entry with credibility weighting"""
-        # Get published date
-        published_date = 'Unknown'
-        if 'published_parsed' in entry and entry.published_parsed:
-            published_date = datetime(*entry.published_parsed[:6]).isoformat()
-        elif 'updated_parsed' in entry and entry.updated_parsed:
-            published_date = datetime(*entry.updated_parsed[:6]).isoformat()
+        if text.isascii():
+            found = {self._COMPANY_NAMES[word]
+                     for word in self._COMPANY_WORDS.intersection(self._WORD_RE.findall(text.lower()))}
+        else:
+            found = {self._COMPANY_WORD_LIST[m.lastindex - 1] for m in self._COMPANY_WORD_RE.finditer(text)}
+        found.update(self._COMPANY_PHRASES[m.lastindex - 1] for m in self._COMPANY_RE.finditer(text))
+        return [company for company in self.AI_COMPANIES if company in found]
+    
+    def extract_entry_data(self, entry, feed_name: str, feed_url: str,
+                           min_final_score: int = 0) -> Optional[Article]:
+        """
+        Extract data from a feed entry with credibility weighting
         
-        # Extract companies mentioned
-        summary_text = entry.get('summary', '') + ' ' + entry.get('title', '')
-        companies = self.extract_companies(summary_text)
+        Scores the entry first and returns None if its final score falls
+        below min_final_score, before any other field is extracted.
+        """
+        title = entry.get('title', '')
+        summary = entry.get('summary', '')
         
         # Get source credibility info
         source_info = self.get_source_info(feed_name)
         
-        # Calculate base score
-        base_score = self.calculate_base_ai_score({
-            'title': entry.get('title', ''),
-            'summary': entry.get('summary', '')
-        })
+        # Calculate base score, lowercasing each field only once
+        title_lower = title.lower()
+        base_score = self.calculate_base_ai_score(title_lower, f"{title_lower} {summary.lower()}")
         
         # Apply source weighting
         final_score = self.calculate_weighted_score(base_score, source_info['multiplier'])
+        if final_score < min_final_score:
+            return None
         
-        entry_data = {
-            'title': entry.get('title', 'N/A'),
-            'link': entry.get('link', 'N/A'),
-            'published_date': published_date,
-            'author': entry.get('author', 'N/A'),
-            'summary': entry.get('summary', entry.get('description', 'N/A')),
-            'feed_name': feed_name,
-            'feed_url': feed_url,
-            'tags': ', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A',
-            'companies_mentioned': ', '.join(companies) if companies else 'N/A',
+        # Get published date
+        published = None
+        if 'published_parsed' in entry and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+        elif 'updated_parsed' in entry and entry.updated_parsed:
+            published = datetime(*entry.updated_parsed[:6])
+        
+        # Extract companies mentioned (the regex is case-insensitive, so no lowering)
+        companies = self.extract_companies(f"{summary} {title}")
+        tags = entry.get('tags')
+        
+        return Article(
+            title=entry.get('title', 'N/A'),
+            link=entry.get('link', 'N/A'),
+            published_date=published.isoformat() if published else 'Unknown',
+            author=entry.get('author', 'N/A'),
+            summary=entry.get('summary', entry.get('description', 'N/A')),
+            feed_name=feed_name,
+            feed_url=feed_url,
+            tags=', '.join([tag.term for tag in tags]) if tags else 'N/A',
+            companies_mentioned=', '.join(companies) if companies else 'N/A',
             
             # Source credibility fields
-            'source_tier': source_info['tier'],
-            'source_type': source_info['type'],
-            'source_credibility': source_info['credibility'],
-            'source_multiplier': source_info['multiplier'],
+            source_tier=source_info['tier'],
+            source_type=source_info['type'],
+            source_credibility=source_info['credibility'],
+            source_multiplier=source_info['multiplier'],
             
             # Scoring fields
-            'base_score': base_score,
-            'final_score': final_score,
-            'is_ai_related': final_score >= 30
-        }
-        
-        return entry_data
+            base_score=base_score,
+            final_score=final_score,
+            is_ai_related=final_score >= 30,
+            published=published
+        )
     
     def scrape_ai_news(self, feed_urls: List[str], days_back: int = 7,
-                      min_final_score: int = 30, tier_filter: Optional[int] = None) -> List[Dict]:
+                      min_final_score: int = 30, tier_filter: Optional[int] = None,
+                      max_entries_per_feed: Optional[int] = None) -> List[Article]:
         """
         Scrape AI news from multiple feeds with credibility weighting
         
@@ -217,6 +351,10 @@ class EnhancedAINewsTracker:
             days_back: Only get articles from last N days
             min_final_score: Minimum final score (after weighting)
             tier_filter: Only include sources from tier X or better (1-6)
+            max_entries_per_feed: Only process the first N entries of each feed (None = all)
+        
+        Returns:
+            Matching articles in feed order; use top_articles() for ranking
         """
         cutoff_date = datetime.now() - timedelta(days=days_back)
         
@@ -227,75 +365,93 @@ class EnhancedAINewsTracker:
             print(f"🏆 Source tier filter: Tier {tier_filter} or better")
         print()
         
-        for feed_url in feed_urls:
-            feed = self.fetch_feed(feed_url)
-            if not feed:
-                continue
-            
-            feed_name = feed.feed.get('title', 'Unknown Feed')
-            source_info = self.get_source_info(feed_name)
-            
-            # Apply tier filter
-            if tier_filter and source_info['tier'] > tier_filter:
-                print(f"⏭️  Skipping: {feed_name} (Tier {source_info['tier']})")
-                continue
-            
-            print(f"📰 Processing: {feed_name} [Tier {source_info['tier']}, {source_info['credibility']}]")
-            
-            for entry in feed.entries:
-                entry_data = self.extract_entry_data(entry, feed_name, feed_url)
-                self.all_articles.append(entry_data)
+        # Fetch all feeds concurrently; map() yields them back in input order
+        workers = max(1, min(self.max_workers, len(feed_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for feed_url, feed in zip(feed_urls, executor.map(self.fetch_feed, feed_urls)):
+                if not feed:
+                    continue
+                
+                feed_name = feed.feed.get('title', 'Unknown Feed')
+                source_info = self.get_source_info(feed_name)
                 
-                # Filter by date
-                if entry_data['published_date'] != 'Unknown':
-                    try:
-                        pub_date = datetime.fromisoformat(entry_data['published_date'])
-                        if pub_date < cutoff_date:
-                            continue
-                    except:
-                        pass
+                # Apply tier filter
+                if tier_filter and source_info['tier'] > tier_filter:
+                    print(f"⏭️  Skipping: {feed_name} (Tier {source_info['tier']})")
+                    continue
                 
-                # Filter by final score
-                if entry_data['final_score'] >= min_final_score:
+                print(f"📰 Processing: {feed_name} [Tier {source_info['tier']}, {source_info['credibility']}]")
+                
+                for entry in islice(feed.entries, max_entries_per_feed):
+                    self.total_articles += 1
+                    # Below-threshold entries come back as None without being fully extracted
+                    entry_data = self.extract_entry_data(entry, feed_name, feed_url, min_final_score)
+                    if entry_data is None:
+                        continue
+                    
+                    # Filter by date
+                    if entry_data.published and entry_data.published < cutoff_date:
+                        continue
+                    
                     self.ai_articles.append(entry_data)
         
-        # Sort by final score (highest first)
-        self.ai_articles.sort(key=lambda x: x['final_score'], reverse=True)
+        # The list was extended in place, so any cached ranking is stale
+        self._sorted_articles = None
         
-        print(f"\n✅ Found {len(self.ai_articles)} AI-related articles (out of {len(self.all_articles)} total)")
+        print(f"\n✅ Found {len(self.ai_articles)} AI-related articles (out of {self.total_articles} total)")
         return self.ai_articles
     
+    def top_articles(self, n: Optional[int] = None) -> List[Article]:
+        """
+        Return articles by final score (highest first)
+        
+        The full ranking is sorted once and cached per article list, so the
+        JSON and CSV exports share it. With n and no cached ranking, only the
+        top n are selected via a heap instead of sorting everything.
+        """
+        cached = self._sorted_articles
+        if cached is not None and cached[0] is self.ai_articles:
+            return cached[1] if n is None else cached[1][:n]
+        if n is not None:
+            return heapq.nlargest(n, self.ai_articles, key=self._SCORE_KEY)
+        ranked = sorted(self.ai_articles, key=self._SCORE_KEY, reverse=True)
+        self._sorted_articles = (self.ai_articles, ranked)
+        return ranked
+    
     def display_summary(self):
         """Display summary with source credibility analysis"""
         if not self.ai_articles:
             print("No AI articles found")
             return
         
-        print("\n" + "="*80)
-        print("🤖 AI NEWS SUMMARY (Source-Weighted)")
-        print("="*80)
+        lines = []
+        emit = lines.append
+        
+        emit("\n" + "="*80)
+        emit("🤖 AI NEWS SUMMARY (Source-Weighted)")
+        emit("="*80)
         
         # Top articles
-        print(f"\n📊 Top 10 AI Articles (by credibility-weighted score):\n")
-        for i, article in enumerate(self.ai_articles[:10], 1):
-            tier_emoji = "🏆" if article['source_tier'] <= 2 else "⭐" if article['source_tier'] <= 4 else "📄"
-            print(f"{i}. {tier_emoji} [{article['final_score']}/100] {article['title']}")
-            print(f"   📰 {article['feed_name']} | Tier {article['source_tier']} ({article['source_credibility']})")
-            print(f"   📅 {article['published_date'][:10]}")
-            print(f"   🔗 {article['link']}")
-            print(f"   📈 Base: {article['base_score']} → Final: {article['final_score']} (×{article['source_multiplier']})")
-            if article['companies_mentioned'] != 'N/A':
-                print(f"   🏢 {article['companies_mentioned']}")
-            print()
+        emit(f"\n📊 Top 10 AI Articles (by credibility-weighted score):\n")
+        for i, article in enumerate(self.top_articles(10), 1):
+            tier_emoji = "🏆" if article.source_tier <= 2 else "⭐" if article.source_tier <= 4 else "📄"
+            emit(f"{i}. {tier_emoji} [{article.final_score}/100] {article.title}")
+            emit(f"   📰 {article.feed_name} | Tier {article.source_tier} ({article.source_credibility})")
+            emit(f"   📅 {article.published_date[:10]}")
+            emit(f"   🔗 {article.link}")
+            emit(f"   📈 Base: {article.base_score} → Final: {article.final_score} (×{article.source_multiplier})")
+            if article.companies_mentioned != 'N/A':
+                emit(f"   🏢 {article.companies_mentioned}")
+            emit('')
         
         # Statistics
-        print("="*80)
-        print("📈 STATISTICS")
-        print("="*80)
+        emit("="*80)
+        emit("📈 STATISTICS")
+        emit("="*80)
         
         # Source tier breakdown
-        tier_counts = Counter(article['source_tier'] for article in self.ai_articles)
-        print("\n🏆 Articles by Source Tier:")
+        tier_counts = Counter(article.source_tier for article in self.ai_articles)
+        emit("\n🏆 Articles by Source Tier:")
         tier_names = {
             1: "Premier Academic/Research",
             2: "Company Research Blogs",
@@ -307,42 +463,44 @@ class EnhancedAINewsTracker:
         for tier in sorted(tier_counts.keys()):
             count = tier_counts[tier]
             percentage = (count / len(self.ai_articles)) * 100
-            print(f"   Tier {tier} ({tier_names.get(tier, 'Other')}): {count} articles ({percentage:.1f}%)")
+            emit(f"   Tier {tier} ({tier_names.get(tier, 'Other')}): {count} articles ({percentage:.1f}%)")
         
         # Credibility distribution
-        cred_counts = Counter(article['source_credibility'] for article in self.ai_articles)
-        print("\n🎖️  Articles by Credibility:")
+        cred_counts = Counter(article.source_credibility for article in self.ai_articles)
+        emit("\n🎖️  Articles by Credibility:")
         for cred, count in cred_counts.most_common():
             percentage = (count / len(self.ai_articles)) * 100
-            print(f"   {cred}: {count} articles ({percentage:.1f}%)")
+            emit(f"   {cred}: {count} articles ({percentage:.1f}%)")
         
         # Source type breakdown
-        type_counts = Counter(article['source_type'] for article in self.ai_articles)
-        print("\n📰 Articles by Source Type:")
+        type_counts = Counter(article.source_type for article in self.ai_articles)
+        emit("\n📰 Articles by Source Type:")
         for stype, count in type_counts.most_common():
             percentage = (count / len(self.ai_articles)) * 100
-            print(f"   {stype}: {count} articles ({percentage:.1f}%)")
+            emit(f"   {stype}: {count} articles ({percentage:.1f}%)")
         
         # Company mentions
-        all_companies = []
+        company_counts = Counter()
         for article in self.ai_articles:
-            if article['companies_mentioned'] != 'N/A':
-                all_companies.extend(article['companies_mentioned'].split(', '))
+            if article.companies_mentioned != 'N/A':
+                company_counts.update(article.companies_mentioned.split(', '))
         
-        if all_companies:
-            company_counts = Counter(all_companies)
-            print("\n🏢 Most Mentioned Companies:")
+        if company_counts:
+            emit("\n🏢 Most Mentioned Companies:")
             for company, count in company_counts.most_common(10):
-                print(f"   {company}: {count} mentions")
+                emit(f"   {company}: {count} mentions")
         
         # Top sources
-        feed_counts = Counter(article['feed_name'] for article in self.ai_articles)
-        print("\n📰 Top Sources:")
+        feed_counts = Counter(article.feed_name for article in self.ai_articles)
+        emit("\n📰 Top Sources:")
         for feed, count in feed_counts.most_common(10):
             source_info = self.get_source_info(feed)
-            print(f"   {feed}: {count} articles [Tier {source_info['tier']}]")
+            emit(f"   {feed}: {count} articles [Tier {source_info['tier']}]")
+        
+        emit("\n" + "="*80 + "\n")
         
-        print("\n" + "="*80 + "\n")
+        # One write for the whole report instead of a print() per line
+        print('\n'.join(lines))
     
     def export_to_json(self, filename: str = "ai_news_credibility_weighted.json"):
         """Export with source credibility data"""
@@ -350,11 +508,16 @@ class EnhancedAINewsTracker:
             'generated_at': datetime.now().isoformat(),
             'total_articles': len(self.ai_articles),
             'source_tiers_used': self.SOURCE_TIERS,
-            'articles': self.ai_articles
+            'articles': [article.to_dict() for article in self.top_articles()]
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"📄 Exported {len(self.ai_articles)} articles to {filename}")
     
     def export_to_csv(self, filename: str = "ai_news_credibility_weighted.csv"):
@@ -363,21 +526,43 @@ class EnhancedAINewsTracker:
             print("No articles to export")
             return
         
-        keys = self.ai_articles[0].keys()
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
             writer.writeheader()
-            writer.writerows(self.ai_articles)
+            writer.writerows(article.to_dict() for article in self.top_articles())
         
         print(f"📊 Exported {len(self.ai_articles)} articles to {filename}")
     
     def export_html_report(self, filename: str = "ai_news_credibility_report.html"):
         """Generate enhanced HTML report with credibility indicators"""
         
-        # Calculate tier distribution for visualization
-        tier_counts = Counter(article['source_tier'] for article in self.ai_articles)
+        # Calculate tier distribution for visualization (also gives the high-credibility count)
+        tier_counts = Counter(article.source_tier for article in self.ai_articles)
+        high_credibility = tier_counts[1] + tier_counts[2]
         
-        html = f"""<!DOCTYPE html>
+        # Article block, filled in per article with str.format
+        article_template = """
+    <div class="article{high_cred}">
+        <h2>{tier_emoji} <a href="{link}" target="_blank">{title}</a></h2>
+        <div class="meta">
+            <span class="score">Final Score: {final_score}/100</span>
+            <span class="tier-badge tier-{tier}">Tier {tier}: {credibility}</span>
+            <br>
+            📰 {feed_name} ({source_type}) | 
+            📅 {date}
+            {author}
+        </div>
+        <div class="score-breakdown">
+            📈 Base Score: {base_score} → Final Score: {final_score} (×{multiplier} multiplier)
+        </div>
+        {companies}
+        <div class="summary">{summary}</div>
+    </div>
+"""
+        
+        # Write straight to the file instead of growing one big string
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -497,11 +682,11 @@ class EnhancedAINewsTracker:
         </div>
         <div class="stat-box">
             <h3>High Credibility</h3>
-            <div class="number">{sum(1 for a in self.ai_articles if a['source_tier'] <= 2)}</div>
+            <div class="number">{high_credibility}</div>
         </div>
         <div class="stat-box">
             <h3>Avg Final Score</h3>
-            <div class="number">{int(sum(a['final_score'] for a in self.ai_articles) / len(self.ai_articles))}</div>
+            <div class="number">{int(sum(a.final_score for a in self.ai_articles) / len(self.ai_articles))}</div>
         </div>
     </div>
     
@@ -514,39 +699,32 @@ class EnhancedAINewsTracker:
         <span class="tier-badge tier-5">Tier 5 (General): {tier_counts.get(5, 0)}</span>
     </p>
     <hr>
-"""
-        
-        for article in self.ai_articles[:50]:
-            tier_class = f"tier-{article['source_tier']}"
-            high_cred = " high-credibility" if article['source_tier'] <= 2 else ""
-            tier_emoji = "🏆" if article['source_tier'] <= 2 else "⭐" if article['source_tier'] <= 4 else "📄"
+""")
             
-            html += f"""
-    <div class="article{high_cred}">
-        <h2>{tier_emoji} <a href="{article['link']}" target="_blank">{article['title']}</a></h2>
-        <div class="meta">
-            <span class="score">Final Score: {article['final_score']}/100</span>
-            <span class="tier-badge {tier_class}">Tier {article['source_tier']}: {article['source_credibility']}</span>
-            <br>
-            📰 {article['feed_name']} ({article['source_type']}) | 
-            📅 {article['published_date'][:10]}
-            {' | ✍️ ' + article['author'] if article['author'] != 'N/A' else ''}
-        </div>
-        <div class="score-breakdown">
-            📈 Base Score: {article['base_score']} → Final Score: {article['final_score']} (×{article['source_multiplier']} multiplier)
-        </div>
-        {f'<div class="companies">🏢 Companies: {article["companies_mentioned"]}</div>' if article['companies_mentioned'] != 'N/A' else ''}
-        <div class="summary">{article['summary'][:500]}{'...' if len(article['summary']) > 500 else ''}</div>
-    </div>
-"""
-        
-        html += """
+            for article in self.top_articles(50):
+                tier_emoji = "🏆" if article.source_tier <= 2 else "⭐" if article.source_tier <= 4 else "📄"
+                f.write(article_template.format(
+                    high_cred=" high-credibility" if article.source_tier <= 2 else "",
+                    tier_emoji=tier_emoji,
+                    link=article.link,
+                    title=article.title,
+                    final_score=article.final_score,
+                    tier=article.source_tier,
+                    credibility=article.source_credibility,
+                    feed_name=article.feed_name,
+                    source_type=article.source_type,
+                    date=article.published_date[:10],
+                    author=' | ✍️ ' + article.author if article.author != 'N/A' else '',
+                    base_score=article.base_score,
+                    multiplier=article.source_multiplier,
+                    companies=f'<div class="companies">🏢 Companies: {article.companies_mentioned}</div>' if article.companies_mentioned != 'N/A' else '',
+                    summary=article.summary[:500] + ('...' if len(article.summary) > 500 else '')
+                ))
+            
+            f.write("""
 </body>
 </html>
-"""
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+""")
         
         print(f"📱 Generated HTML report: {filename}")
 
@@ -555,6 +733,12 @@ def main():
     """Main function"""
     import argparse
     
+    def non_negative_int(value: str) -> int:
+        number = int(value)
+        if number < 0:
+            raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+        return number
+    
     parser = argparse.ArgumentParser(description="Enhanced AI News Tracker with Source Credibility")
     parser.add_argument('-f', '--feeds-file', default='ai_news_feeds_enhanced.txt',
                        help='File containing RSS feed URLs')
@@ -566,6 +750,8 @@ def main():
                        help='Only include sources from this tier or better')
     parser.add_argument('-o', '--output', choices=['json', 'csv', 'html', 'all'],
                        default='all', help='Output format')
+    parser.add_argument('-m', '--max-entries', type=non_negative_int,
+                       help='Only process the first N entries of each feed')
     
     args = parser.parse_args()
     
@@ -585,7 +771,8 @@ def main():
     # Create tracker and scrape
     tracker = EnhancedAINewsTracker()
     tracker.scrape_ai_news(feed_urls, days_back=args.days, 
-                          min_final_score=args.score, tier_filter=args.tier)
+                          min_final_score=args.score, tier_filter=args.tier,
+                          max_entries_per_feed=args.max_entries)
     
     # Display results
     tracker.display_summary()
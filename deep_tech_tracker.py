@@ -12,6 +12,47 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import re
 from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+try:
+    import ahocorasick  # optional C automaton for keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional Rust JSON serializer
+except ImportError:
+    orjson = None
+
+
+def build_keyword_automaton(sectors: Dict[str, List[str]], funding_stages: Dict[str, List[str]],
+                            impact_keywords: List[str]):
+    """
+    Compile sector, funding-stage and impact keywords into one Aho-Corasick automaton
+    
+    Each keyword maps to the (kind, label) pairs it signals, e.g. 'fusion' ->
+    (('sector', 'Clean Energy'), ('sector', 'Fusion Energy')).
+    Returns None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    labels = {}
+    for sector, keywords in sectors.items():
+        for keyword in keywords:
+            labels.setdefault(keyword, []).append(('sector', sector))
+    for stage, patterns in funding_stages.items():
+        for pattern in patterns:
+            labels.setdefault(pattern, []).append(('funding', stage))
+    for keyword in impact_keywords:
+        labels.setdefault(keyword, []).append(('impact', keyword))
+    automaton = ahocorasick.Automaton()
+    for keyword, hits in labels.items():
+        automaton.add_word(keyword, tuple(hits))
+    automaton.make_automaton()
+    return automaton
 
 
 class DeepTechTracker:
@@ -115,17 +156,66 @@ class DeepTechTracker:
         'Neuralink', 'Synchron', 'Kernel', 'Paradromics',
         'Desktop Metal', 'Carbon', 'Formlabs', 'Velo3D'
     ]
+    # Single-word names are looked up as whole \w+ tokens (same as matching \bName\b).
+    # The rest go through one alternation, longest first, as a zero-width lookahead
+    # so overlapping names ('Helion Energy Vault') are all found. Each name is its
+    # own group, so m.lastindex maps a match back to it even when IGNORECASE matched
+    # a case-folded spelling ('ıbm quantum'). Such spellings ('rıgetti') are not
+    # ASCII, so non-ASCII text scans single words the same way.
+    _WORD_RE = re.compile(r'\w+')
+    _ORG_WORDS = frozenset(o.lower() for o in DEEP_TECH_ORGS if re.fullmatch(r'\w+', o))
+    _ORG_WORD_LIST = [o for o in DEEP_TECH_ORGS if re.fullmatch(r'\w+', o)]
+    _ORG_WORD_RE = re.compile(
+        r'\b(?:' + '|'.join('(' + re.escape(o) + ')' for o in _ORG_WORD_LIST) + r')\b',
+        re.IGNORECASE)
+    _ORG_PHRASES = sorted((o for o in DEEP_TECH_ORGS if not re.fullmatch(r'\w+', o)),
+                          key=len, reverse=True)
+    _ORG_RE = re.compile(
+        r'\b(?=(?:' + '|'.join('(' + re.escape(o) + ')' for o in _ORG_PHRASES) + r')\b)',
+        re.IGNORECASE)
+    _ORG_NAMES = {org.lower(): org for org in DEEP_TECH_ORGS}
     
-    def __init__(self, user_agent: str = "DeepTech-Tracker/1.0"):
+    # Funding stages in priority order (the first stage mentioned wins)
+    FUNDING_STAGES = {
+        'Seed': ['seed round', 'seed funding', 'pre-seed'],
+        'Series A': ['series a', 'series-a'],
+        'Series B': ['series b', 'series-b'],
+        'Series C': ['series c', 'series-c'],
+        'Series D+': ['series d', 'series e', 'series f'],
+        'IPO': ['ipo', 'initial public offering', 'going public'],
+        'Acquisition': ['acquired', 'acquisition', 'acquires'],
+        'Grant': ['grant', 'awarded', 'government funding']
+    }
+    
+    # Funding/breakthrough keywords that earn a relevance bonus
+    HIGH_IMPACT_KEYWORDS = [
+        'breakthrough', 'first', 'novel', 'raises', 'funding',
+        'series a', 'series b', 'milestone', 'achievement',
+        'record', 'demonstration', 'prototype', 'commercial'
+    ]
+    
+    # All of the above in one automaton, so an article is scanned once
+    _KEYWORD_AUTOMATON = build_keyword_automaton(SECTORS, FUNDING_STAGES, HIGH_IMPACT_KEYWORDS)
+    _SECTOR_KEYWORDS = tuple(dict.fromkeys(chain.from_iterable(SECTORS.values())))
+    
+    def __init__(self, user_agent: str = "DeepTech-Tracker/1.0", max_workers: int = 32):
         self.user_agent = user_agent
-        self.all_articles = []
+        self.max_workers = max_workers
+        self.total_articles = 0
         self.deep_tech_articles = []
+        self._aggregates = None
+        
+        # One keep-alive session shared by all fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
         """Fetch and parse an RSS feed"""
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=15)
+            response = self.session.get(feed_url, headers=headers, timeout=15)
             response.raise_for_status()
             feed = feedparser.parse(response.content)
             return feed
@@ -133,98 +223,127 @@ class DeepTechTracker:
             print(f"⚠️  Error fetching {feed_url}: {e}")
             return None
     
+    def scan_keywords(self, text_lower: str) -> Dict[str, set]:
+        """
+        Find the sectors, funding stages and impact keywords in lowercased text
+        
+        Returns:
+            {'sector': {...}, 'funding': {...}, 'impact': {...}} sets of labels
+        """
+        hits = {'sector': set(), 'funding': set(), 'impact': set()}
+        if self._KEYWORD_AUTOMATON is not None:
+            for _, labels in self._KEYWORD_AUTOMATON.iter(text_lower):
+                for kind, label in labels:
+                    hits[kind].add(label)
+            return hits
+        
+        hits['sector'] = {sector for sector, keywords in self.SECTORS.items()
+                          if any(keyword in text_lower for keyword in keywords)}
+        hits['funding'] = {stage for stage, patterns in self.FUNDING_STAGES.items()
+                           if any(pattern in text_lower for pattern in patterns)}
+        hits['impact'] = {keyword for keyword in self.HIGH_IMPACT_KEYWORDS if keyword in text_lower}
+        return hits
+    
+    def has_sector_keyword(self, text_lower: str) -> bool:
+        """Whether lowercased text contains any sector keyword, stopping at the first"""
+        if self._KEYWORD_AUTOMATON is not None:
+            return any(kind == 'sector'
+                       for _, labels in self._KEYWORD_AUTOMATON.iter(text_lower)
+                       for kind, _ in labels)
+        return any(keyword in text_lower for keyword in self._SECTOR_KEYWORDS)
+    
     def detect_sectors(self, text: str) -> List[str]:
         """Detect which deep tech sectors are mentioned in text"""
-        text_lower = text.lower()
-        detected_sectors = []
-        
-        for sector, keywords in self.SECTORS.items():
-            if any(keyword in text_lower for keyword in keywords):
-                detected_sectors.append(sector)
-        
-        return detected_sectors
+        sector_hits = self.scan_keywords(text.lower())['sector']
+        return [sector for sector in self.SECTORS if sector in sector_hits]
     
-    def calculate_relevance_score(self, entry: Dict) -> int:
-        """Calculate deep tech relevance score (0-100)"""
+    def calculate_relevance_score(self, title_lower: str, hits: Dict[str, set]) -> int:
+        """
+        Calculate deep tech relevance score (0-100)
+        
+        Args:
+            title_lower: Lowercased article title
+            hits: scan_keywords() result for the lowercased "title summary" text
+        """
         score = 0
-        text = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
         
         # Count sector matches
-        detected_sectors = self.detect_sectors(text)
+        detected_sectors = hits['sector']
         score += len(detected_sectors) * 15  # 15 points per sector
         
         # Bonus for multiple sectors (interdisciplinary)
         if len(detected_sectors) >= 2:
             score += 20
         
-        # Bonus for sector keywords in title
-        title_lower = entry.get('title', '').lower()
-        for sector, keywords in self.SECTORS.items():
-            if any(keyword in title_lower for keyword in keywords):
-                score += 10
-                break
+        # Bonus for sector keywords in title (the title is part of the scanned text,
+        # so it can only have one if the article matched a sector)
+        if detected_sectors and self.has_sector_keyword(title_lower):
+            score += 10
         
         # Bonus for funding/breakthrough keywords
-        high_impact_keywords = [
-            'breakthrough', 'first', 'novel', 'raises', 'funding',
-            'series a', 'series b', 'milestone', 'achievement',
-            'record', 'demonstration', 'prototype', 'commercial'
-        ]
-        if any(keyword in text for keyword in high_impact_keywords):
+        if hits['impact']:
             score += 15
         
         return min(score, 100)
     
     def extract_organizations(self, text: str) -> List[str]:
         """Extract mentioned deep tech organizations"""
-        found_orgs = []
-        for org in self.DEEP_TECH_ORGS:
-            if re.search(r'\b' + re.escape(org) + r'\b', text, re.IGNORECASE):
-                found_orgs.append(org)
-        return found_orgs
+        if text.isascii():
+            found = {self._ORG_NAMES[word]
+                     for word in self._ORG_WORDS.intersection(self._WORD_RE.findall(text.lower()))}
+        else:
+            found = {self._ORG_WORD_LIST[m.lastindex - 1] for m in self._ORG_WORD_RE.finditer(text)}
+        found.update(self._ORG_PHRASES[m.lastindex - 1] for m in self._ORG_RE.finditer(text))
+        return [org for org in self.DEEP_TECH_ORGS if org in found]
     
     def categorize_funding_stage(self, text: str) -> Optional[str]:
         """Detect funding stage if mentioned"""
-        text_lower = text.lower()
-        
-        funding_stages = {
-            'Seed': ['seed round', 'seed funding', 'pre-seed'],
-            'Series A': ['series a', 'series-a'],
-            'Series B': ['series b', 'series-b'],
-            'Series C': ['series c', 'series-c'],
-            'Series D+': ['series d', 'series e', 'series f'],
-            'IPO': ['ipo', 'initial public offering', 'going public'],
-            'Acquisition': ['acquired', 'acquisition', 'acquires'],
-            'Grant': ['grant', 'awarded', 'government funding']
-        }
-        
-        for stage, patterns in funding_stages.items():
-            if any(pattern in text_lower for pattern in patterns):
-                return stage
-        
-        return None
+        stage_hits = self.scan_keywords(text.lower())['funding']
+        return next((stage for stage in self.FUNDING_STAGES if stage in stage_hits), None)
     
-    def extract_entry_data(self, entry, feed_name: str, feed_url: str) -> Dict:
-        """Extract data from a feed entry"""
-        # Get published date
-        published_date = 'Unknown'
+    def get_published_date(self, entry) -> Optional[datetime]:
+        """Published (or updated) date of a feed entry, if it has one"""
         if 'published_parsed' in entry and entry.published_parsed:
-            published_date = datetime(*entry.published_parsed[:6]).isoformat()
+            return datetime(*entry.published_parsed[:6])
         elif 'updated_parsed' in entry and entry.updated_parsed:
-            published_date = datetime(*entry.updated_parsed[:6]).isoformat()
+            return datetime(*entry.updated_parsed[:6])
+        return None
+    
+    def extract_entry_data(self, entry, feed_name: str, feed_url: str,
+                           min_relevance_score: int = 0,
+                           published: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Extract data from a feed entry
+        
+        Scores the entry first and returns None if it falls below
+        min_relevance_score, skipping organization and funding extraction.
+        """
+        # Lowercase once; one keyword scan feeds sectors, funding stage and scoring
+        title = entry.get('title', 'N/A')
+        summary = entry.get('summary', entry.get('description', 'N/A'))
+        title_lower = title.lower()
+        text_lower = f"{title_lower} {summary.lower()}"
+        hits = self.scan_keywords(text_lower)
+        
+        # Calculate relevance
+        relevance_score = self.calculate_relevance_score(title_lower, hits)
+        if relevance_score < min_relevance_score:
+            return None
+        
+        if published is None:
+            published = self.get_published_date(entry)
         
         # Extract data
-        summary_text = entry.get('summary', '') + ' ' + entry.get('title', '')
-        sectors = self.detect_sectors(summary_text)
-        organizations = self.extract_organizations(summary_text)
-        funding_stage = self.categorize_funding_stage(summary_text)
+        sectors = [sector for sector in self.SECTORS if sector in hits['sector']]
+        organizations = self.extract_organizations(text_lower)
+        funding_stage = next((stage for stage in self.FUNDING_STAGES if stage in hits['funding']), None)
         
         entry_data = {
-            'title': entry.get('title', 'N/A'),
+            'title': title,
             'link': entry.get('link', 'N/A'),
-            'published_date': published_date,
+            'published_date': published.isoformat() if published else 'Unknown',
             'author': entry.get('author', 'N/A'),
-            'summary': entry.get('summary', entry.get('description', 'N/A')),
+            'summary': summary,
             'feed_name': feed_name,
             'feed_url': feed_url,
             'sectors': ', '.join(sectors) if sectors else 'General',
@@ -234,9 +353,8 @@ class DeepTechTracker:
             'tags': ', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A'
         }
         
-        # Calculate relevance
-        entry_data['relevance_score'] = self.calculate_relevance_score(entry_data)
-        entry_data['is_deep_tech'] = entry_data['relevance_score'] >= 20
+        entry_data['relevance_score'] = relevance_score
+        entry_data['is_deep_tech'] = relevance_score >= 20
         
         return entry_data
     
@@ -249,37 +367,66 @@ class DeepTechTracker:
         print(f"📅 Looking for articles from the last {days_back} days")
         print(f"🎯 Minimum relevance score: {min_relevance_score}/100\n")
         
-        for feed_url in feed_urls:
-            feed = self.fetch_feed(feed_url)
-            if not feed:
-                continue
-            
-            feed_name = feed.feed.get('title', 'Unknown Feed')
-            print(f"📡 Processing: {feed_name}")
-            
-            for entry in feed.entries:
-                entry_data = self.extract_entry_data(entry, feed_name, feed_url)
-                self.all_articles.append(entry_data)
+        # Fetch all feeds concurrently; map() yields them back in input order
+        workers = max(1, min(self.max_workers, len(feed_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for feed_url, feed in zip(feed_urls, executor.map(self.fetch_feed, feed_urls)):
+                if not feed:
+                    continue
                 
-                # Filter by date
-                if entry_data['published_date'] != 'Unknown':
-                    try:
-                        pub_date = datetime.fromisoformat(entry_data['published_date'])
-                        if pub_date < cutoff_date:
-                            continue
-                    except:
-                        pass
+                feed_name = feed.feed.get('title', 'Unknown Feed')
+                print(f"📡 Processing: {feed_name}")
                 
-                # Filter by relevance
-                if entry_data['relevance_score'] >= min_relevance_score:
-                    self.deep_tech_articles.append(entry_data)
-        
-        # Sort by relevance score
-        self.deep_tech_articles.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        print(f"\n✅ Found {len(self.deep_tech_articles)} deep tech articles (out of {len(self.all_articles)} total)")
+                for entry in feed.entries:
+                    self.total_articles += 1
+                    
+                    # Filter by date before any text scanning
+                    published = self.get_published_date(entry)
+                    if published and published < cutoff_date:
+                        continue
+                    
+                    # Below-threshold entries come back as None without being fully extracted
+                    entry_data = self.extract_entry_data(entry, feed_name, feed_url,
+                                                         min_relevance_score, published)
+                    if entry_data is not None:
+                        self.deep_tech_articles.append(entry_data)
+        
+        # Sort once by relevance score; JSON, CSV and the sector report all need the full ranking
+        self.deep_tech_articles.sort(key=itemgetter('relevance_score'), reverse=True)
+        # The list was extended in place, so cached counts are stale
+        self._aggregates = None
+        
+        print(f"\n✅ Found {len(self.deep_tech_articles)} deep tech articles (out of {self.total_articles} total)")
         return self.deep_tech_articles
     
+    def _compute_aggregates(self) -> Dict[str, Counter]:
+        """Count sectors, organizations, funding stages and sources in one pass"""
+        # Cached per article list, so a later reassignment (e.g. --sector filtering) recounts
+        if self._aggregates is not None and self._aggregates[0] is self.deep_tech_articles:
+            return self._aggregates[1]
+        
+        sector_counts = Counter()
+        org_counts = Counter()
+        funding_counts = Counter()
+        feed_counts = Counter()
+        for article in self.deep_tech_articles:
+            if article['sectors'] != 'General':
+                sector_counts.update(article['sectors'].split(', '))
+            if article['organizations'] != 'N/A':
+                org_counts.update(article['organizations'].split(', '))
+            if article['funding_stage'] != 'N/A':
+                funding_counts[article['funding_stage']] += 1
+            feed_counts[article['feed_name']] += 1
+        
+        aggregates = {
+            'sectors': sector_counts,
+            'organizations': org_counts,
+            'funding': funding_counts,
+            'feeds': feed_counts
+        }
+        self._aggregates = (self.deep_tech_articles, aggregates)
+        return aggregates
+    
     def display_summary(self):
         """Display summary of deep tech news"""
         if not self.deep_tech_articles:
@@ -308,50 +455,47 @@ class DeepTechTracker:
         print("📈 DEEP TECH STATISTICS")
         print("="*80)
         
-        # Sector breakdown
-        sector_counts = Counter()
-        for article in self.deep_tech_articles:
-            sectors = article['sectors'].split(', ')
-            for sector in sectors:
-                if sector != 'General':
-                    sector_counts[sector] += 1
+        aggregates = self._compute_aggregates()
         
+        # Sector breakdown
         print("\n🏷️  Articles by Sector:")
-        for sector, count in sector_counts.most_common():
+        for sector, count in aggregates['sectors'].most_common():
             percentage = (count / len(self.deep_tech_articles)) * 100
             print(f"   {sector}: {count} articles ({percentage:.1f}%)")
         
         # Organization mentions
-        all_orgs = []
-        for article in self.deep_tech_articles:
-            if article['organizations'] != 'N/A':
-                all_orgs.extend(article['organizations'].split(', '))
-        
-        if all_orgs:
-            org_counts = Counter(all_orgs)
+        org_counts = aggregates['organizations']
+        if org_counts:
             print("\n🏢 Most Mentioned Organizations:")
             for org, count in org_counts.most_common(15):
                 print(f"   {org}: {count} mentions")
         
         # Funding activity
-        funding_counts = Counter(
-            article['funding_stage'] for article in self.deep_tech_articles
-            if article['funding_stage'] != 'N/A'
-        )
-        
+        funding_counts = aggregates['funding']
         if funding_counts:
             print("\n💰 Funding Activity:")
             for stage, count in funding_counts.most_common():
                 print(f"   {stage}: {count} articles")
         
         # Source statistics
-        feed_counts = Counter(article['feed_name'] for article in self.deep_tech_articles)
+        feed_counts = aggregates['feeds']
         print("\n📰 Articles by Source:")
         for feed, count in feed_counts.most_common(10):
             print(f"   {feed}: {count} articles")
         
         print("\n" + "="*80 + "\n")
     
+    @staticmethod
+    def write_json(filename: str, data: Dict):
+        """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    
     def export_to_json(self, filename: str = "deep_tech_news.json"):
         """Export to JSON"""
         data = {
@@ -361,8 +505,7 @@ class DeepTechTracker:
             'articles': self.deep_tech_articles
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.write_json(filename, data)
         print(f"📄 Exported {len(self.deep_tech_articles)} articles to {filename}")
     
     def export_to_csv(self, filename: str = "deep_tech_news.csv"):
@@ -371,26 +514,44 @@ class DeepTechTracker:
             print("No articles to export")
             return
         
-        keys = self.deep_tech_articles[0].keys()
+        keys = list(self.deep_tech_articles[0].keys())
+        row = itemgetter(*keys)
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(self.deep_tech_articles)
+            # Plain writer fed tuples; DictWriter would rebuild a list from each dict in Python
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows(map(row, self.deep_tech_articles))
         
         print(f"📊 Exported {len(self.deep_tech_articles)} articles to {filename}")
     
     def export_html_report(self, filename: str = "deep_tech_report.html"):
         """Generate HTML report"""
         
-        # Calculate sector distribution for chart
-        sector_counts = Counter()
-        for article in self.deep_tech_articles:
-            sectors = article['sectors'].split(', ')
-            for sector in sectors:
-                if sector != 'General':
-                    sector_counts[sector] += 1
+        # Sector distribution for chart, shared with display_summary
+        sector_counts = self._compute_aggregates()['sectors']
+        
+        # Article block, filled in per article with str.format
+        article_template = """
+    <div class="article">
+        <h2><a href="{link}" target="_blank">{title}</a></h2>
+        <div class="meta">
+            <span class="score">Score: {score}/100</span>
+            📅 {date} | 
+            📰 {feed_name}
+            {author}
+            {funding_html}
+        </div>
+        <div class="sector-tags">
+            {sectors_html}
+        </div>
+        {org_html}
+        <div class="summary">{summary}</div>
+    </div>
+"""
         
-        html = f"""<!DOCTYPE html>
+        # Write straight to the file instead of growing one big string
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -534,82 +695,83 @@ class DeepTechTracker:
     
     <h2 style="color: #38bdf8; margin-top: 40px;">📊 Sector Distribution</h2>
     <div class="sector-list">
-"""
-        
-        for sector, count in sector_counts.most_common():
-            percentage = (count / len(self.deep_tech_articles)) * 100
-            html += f'        <div class="sector-item">🏷️ {sector}: {count} ({percentage:.1f}%)</div>\n'
-        
-        html += """    </div>
+""")
+            
+            for sector, count in sector_counts.most_common():
+                percentage = (count / len(self.deep_tech_articles)) * 100
+                f.write(f'        <div class="sector-item">🏷️ {sector}: {count} ({percentage:.1f}%)</div>\n')
+            
+            f.write("""    </div>
     
     <h2 style="color: #38bdf8; margin-top: 40px;">📰 Latest Deep Tech News</h2>
-"""
-        
-        for article in self.deep_tech_articles[:50]:
-            sectors_html = ''.join([f'<span class="sector-tag">{s}</span>' 
-                                   for s in article['sectors'].split(', ')])
+""")
             
-            org_html = ''
-            if article['organizations'] != 'N/A':
-                org_html = f'<div class="org-box">🏢 {article["organizations"]}</div>'
-            
-            funding_html = ''
-            if article['funding_stage'] != 'N/A':
-                funding_html = f' <span class="funding-badge">💰 {article["funding_stage"]}</span>'
+            for article in self.deep_tech_articles[:50]:
+                sectors_html = ''.join([f'<span class="sector-tag">{s}</span>' 
+                                       for s in article['sectors'].split(', ')])
+                
+                # Fields used more than once are read into locals once
+                organizations = article['organizations']
+                funding_stage = article['funding_stage']
+                author = article['author']
+                summary = article['summary']
+                if len(summary) > 600:
+                    summary = summary[:600] + '...'
+                
+                org_html = ''
+                if organizations != 'N/A':
+                    org_html = f'<div class="org-box">🏢 {organizations}</div>'
+                
+                funding_html = ''
+                if funding_stage != 'N/A':
+                    funding_html = f' <span class="funding-badge">💰 {funding_stage}</span>'
+                
+                f.write(article_template.format(
+                    link=article['link'],
+                    title=article['title'],
+                    score=article['relevance_score'],
+                    date=article['published_date'][:10],
+                    feed_name=article['feed_name'],
+                    author=' | ✍️ ' + author if author != 'N/A' else '',
+                    funding_html=funding_html,
+                    sectors_html=sectors_html,
+                    org_html=org_html,
+                    summary=summary
+                ))
             
-            html += f"""
-    <div class="article">
-        <h2><a href="{article['link']}" target="_blank">{article['title']}</a></h2>
-        <div class="meta">
-            <span class="score">Score: {article['relevance_score']}/100</span>
-            📅 {article['published_date'][:10]} | 
-            📰 {article['feed_name']}
-            {' | ✍️ ' + article['author'] if article['author'] != 'N/A' else ''}
-            {funding_html}
-        </div>
-        <div class="sector-tags">
-            {sectors_html}
-        </div>
-        {org_html}
-        <div class="summary">{article['summary'][:600]}{'...' if len(article['summary']) > 600 else ''}</div>
-    </div>
-"""
-        
-        html += """
+            f.write("""
     <footer style="margin-top: 50px; padding-top: 20px; border-top: 2px solid #334155; text-align: center; color: #64748b;">
         <p>Deep Tech Tracker • Monitoring innovation across quantum, biotech, space, robotics, and more</p>
     </footer>
 </body>
 </html>
-"""
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+""")
         
         print(f"📱 Generated HTML report: {filename}")
     
     def export_sector_report(self, filename: str = "deep_tech_by_sector.json"):
         """Export articles grouped by sector"""
-        sectors_data = {}
-        
-        for sector in self.SECTORS.keys():
-            sector_articles = [
-                article for article in self.deep_tech_articles
-                if sector in article['sectors']
-            ]
-            if sector_articles:
-                sectors_data[sector] = {
-                    'count': len(sector_articles),
-                    'articles': sector_articles[:20]  # Top 20 per sector
-                }
+        # Bucket articles by sector in one pass, keeping ranking order within each sector
+        sector_articles = {sector: [] for sector in self.SECTORS}
+        for article in self.deep_tech_articles:
+            for sector in article['sectors'].split(', '):
+                if sector in sector_articles:
+                    sector_articles[sector].append(article)
+        
+        sectors_data = {
+            sector: {
+                'count': len(articles),
+                'articles': articles[:20]  # Top 20 per sector
+            }
+            for sector, articles in sector_articles.items() if articles
+        }
         
         data = {
             'generated_at': datetime.now().isoformat(),
             'sectors': sectors_data
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.write_json(filename, data)
         
         print(f"📑 Exported sector breakdown to {filename}")
 
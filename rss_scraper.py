@@ -8,23 +8,206 @@ import feedparser
 import requests
 import json
 import csv
+import hashlib
+import multiprocessing
+import os
+import pickle
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 import argparse
 from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
+from threading import BoundedSemaphore
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional Rust JSON serializer
+except ImportError:
+    orjson = None
+
+
+class CappedRetry(Retry):
+    """Retry policy that honours Retry-After, but never waits longer than backoff_max"""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.backoff_max)
+
+
+def parse_feed_in_worker(content: bytes) -> feedparser.FeedParserDict:
+    """feedparser.parse for a worker process, keeping the result picklable for the trip back"""
+    feed = feedparser.parse(content)
+    if feed.bozo:
+        try:
+            pickle.dumps(feed.bozo_exception)
+        except (pickle.PicklingError, TypeError, ValueError, AttributeError):
+            # SAXParseException (malformed XML) holds a closed locator; keep its message
+            feed['bozo_exception'] = Exception(str(feed.bozo_exception))
+    return feed
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 class RSSFeedScraper:
     """Main class for scraping RSS feeds"""
     
-    def __init__(self, user_agent: str = "RSS-Feed-Scraper/1.0"):
+    # Parsed feeds kept on disk, keyed by a hash of the raw feed bytes
+    PARSE_CACHE_SIZE = 256
+    
+    # Largest feed body we are willing to read (guards against runaway responses)
+    MAX_FEED_BYTES = 10 * 1024 * 1024
+    
+    # Transient failures (connection errors, 429 and 5xx responses) are retried with
+    # exponential backoff plus jitter, so parallel workers do not retry in lockstep
+    RETRY_POLICY = CappedRetry(
+        total=3, backoff_factor=0.5, backoff_jitter=0.5, backoff_max=30,
+        status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True, raise_on_status=False)
+    
+    # Export file buffer, so many small row writes turn into few large write() calls
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    def __init__(self, user_agent: str = "RSS-Feed-Scraper/1.0", max_workers: int = 32,
+                 per_host: int = 8, cache_dir: Optional[str] = '.rss_cache',
+                 parse_workers: Optional[int] = None):
+        if max_workers < 1 or per_host < 1 or (parse_workers is not None and parse_workers < 1):
+            raise ValueError("max_workers, per_host and parse_workers must be positive")
         self.user_agent = user_agent
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.parse_workers = parse_workers if parse_workers is not None else os.cpu_count() or 1
         self.feeds_data = []
+        
+        # Worker processes for feedparser, only while scrape_multiple_feeds runs
+        self._parse_pool = None
+        
+        # Host -> semaphore capping simultaneous requests to that host
+        self._host_slots = {}
+        
+        # One keep-alive session shared by all fetch threads; each host's pool
+        # holds as many connections as that host may have requests in flight
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=per_host,
+                              max_retries=self.RETRY_POLICY)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Conditional GET cache: feed URL -> {'etag', 'modified', 'digest'}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.feed_cache = self._load_feed_cache()
+    
+    def _load_feed_cache(self) -> Dict:
+        """Load the ETag/Last-Modified index saved by the previous run"""
+        if not self.cache_dir:
+            return {}
+        try:
+            with open(self.cache_dir / 'index.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_feed_cache(self):
+        """Persist the ETag/Last-Modified index and evict least recently used parses"""
+        if not self.cache_dir:
+            return
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self.cache_dir / 'index.json', 'w', encoding='utf-8') as f:
+            json.dump(self.feed_cache, f, indent=2)
+        
+        parsed = sorted(self.cache_dir.glob('*.pickle'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in parsed[self.PARSE_CACHE_SIZE:]:
+            path.unlink(missing_ok=True)
+    
+    def _parsed_feed_path(self, digest: str) -> Path:
+        """Location of the pickled parse result for feed content with this digest"""
+        return self.cache_dir / f'{digest}.pickle'
+    
+    def _load_parsed_feed(self, digest: Optional[str]) -> Optional[feedparser.FeedParserDict]:
+        """Load a cached parse result, marking it as recently used"""
+        if not digest:
+            return None
+        path = self._parsed_feed_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                feed = pickle.load(f)
+        except OSError:
+            return None
+        except Exception:
+            # Truncated or stale pickle (e.g. written by another feedparser version); drop it and re-parse
+            path.unlink(missing_ok=True)
+            return None
+        path.touch()
+        return feed
+    
+    def parse_feed(self, content: bytes) -> feedparser.FeedParserDict:
+        """Parse raw feed bytes, in a worker process when a parse pool is running"""
+        if self._parse_pool is None:
+            return feedparser.parse(content)
+        # The calling fetch thread waits here without holding the GIL
+        return self._parse_pool.submit(parse_feed_in_worker, content).result()
+    
+    def _parse_with_cache(self, content: bytes):
+        """Parse feed bytes, reusing the cached parse of byte-identical content"""
+        if not self.cache_dir:
+            return None, self.parse_feed(content)
+        
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        feed = self._load_parsed_feed(digest)
+        if feed is None:
+            feed = self.parse_feed(content)
+            if not self._store_parsed_feed(digest, feed):
+                return None, feed
+        return digest, feed
+    
+    def _store_parsed_feed(self, digest: str, feed: feedparser.FeedParserDict) -> bool:
+        """Pickle a parse result for reuse; returns False if it cannot be pickled"""
+        try:
+            data = pickle.dumps(feed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, ValueError, AttributeError):
+            # e.g. the SAXParseException feedparser attaches to malformed feeds
+            return False
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self._parsed_feed_path(digest), 'wb') as f:
+            f.write(data)
+        return True
+    
+    def _get(self, feed_url: str, headers: Dict):
+        """
+        GET a URL while holding one of its host's connection slots
+        
+        Returns:
+            (response, body) with the decoded body read straight off the socket,
+            or b'' for error responses
+        """
+        host = urlparse(feed_url).netloc
+        # setdefault is atomic, so threads racing on a new host share one semaphore
+        with self._host_slots.setdefault(host, BoundedSemaphore(self.per_host)):
+            with self.session.get(feed_url, headers=headers, timeout=10, stream=True) as response:
+                content = b''
+                if response.ok:
+                    content = response.raw.read(self.MAX_FEED_BYTES + 1, decode_content=True)
+        if len(content) > self.MAX_FEED_BYTES:
+            raise ValueError(f"feed exceeds {self.MAX_FEED_BYTES} bytes")
+        return response, content
     
     def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
         """
         Fetch and parse an RSS feed from a URL
         
+        Sends If-None-Match/If-Modified-Since from the previous run and, on a
+        304, returns the cached parse instead of downloading the feed again.
+        A downloaded body identical to one parsed before is not parsed again.
+        
         Args:
             feed_url: URL of the RSS feed
             
@@ -34,11 +217,29 @@ class RSSFeedScraper:
         try:
             # Set custom user agent
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=10)
+            cached = self.feed_cache.get(feed_url) if self.cache_dir else None
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('modified'):
+                    headers['If-Modified-Since'] = cached['modified']
+            
+            response, content = self._get(feed_url, headers)
+            if response.status_code == 304:
+                feed = self._load_parsed_feed(cached.get('digest') if cached else None)
+                if feed is not None:
+                    return feed
+                # Cached copy is gone, fall back to a full download
+                response, content = self._get(feed_url, {'User-Agent': self.user_agent})
             response.raise_for_status()
             
-            # Parse the feed
-            feed = feedparser.parse(response.content)
+            # Parse the feed (or load the parse of identical content)
+            digest, feed = self._parse_with_cache(content)
+            
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
+            if digest and (etag or modified):
+                self.feed_cache[feed_url] = {'etag': etag, 'modified': modified, 'digest': digest}
             
             if feed.bozo:
                 print(f"Warning: Feed may be malformed ({feed_url})")
@@ -85,21 +286,26 @@ class RSSFeedScraper:
         entries = []
         feed_entries = feed.entries[:limit] if limit else feed.entries
         
+        # FeedParserDict.get/__contains__ run alias and compatibility logic in Python on
+        # every call; none of the keys below need it, so the plain dict lookup returns the
+        # same values ('description' is its alias for summary, then subtitle)
+        get = dict.get
+        
         for entry in feed_entries:
+            tags = get(entry, 'tags')
             entry_data = {
-                'title': entry.get('title', 'N/A'),
-                'link': entry.get('link', 'N/A'),
-                'published': entry.get('published', entry.get('updated', 'N/A')),
-                'author': entry.get('author', 'N/A'),
-                'summary': entry.get('summary', entry.get('description', 'N/A')),
-                'tags': ', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A',
+                'title': get(entry, 'title', 'N/A'),
+                'link': get(entry, 'link', 'N/A'),
+                'published': get(entry, 'published', get(entry, 'updated', 'N/A')),
+                'author': get(entry, 'author', 'N/A'),
+                'summary': get(entry, 'summary', get(entry, 'subtitle', 'N/A')),
+                'tags': ', '.join([tag.term for tag in tags]) if tags else 'N/A',
             }
             
-            # Try to extract a clean published date
-            if 'published_parsed' in entry and entry.published_parsed:
-                entry_data['published_date'] = datetime(*entry.published_parsed[:6]).isoformat()
-            elif 'updated_parsed' in entry and entry.updated_parsed:
-                entry_data['published_date'] = datetime(*entry.updated_parsed[:6]).isoformat()
+            # Try to extract a clean published date (ISO format straight from the struct_time)
+            parsed = get(entry, 'published_parsed') or get(entry, 'updated_parsed')
+            if parsed:
+                entry_data['published_date'] = time.strftime('%Y-%m-%dT%H:%M:%S', parsed)
             else:
                 entry_data['published_date'] = 'N/A'
             
@@ -121,6 +327,22 @@ class RSSFeedScraper:
         print(f"Scraping feed: {feed_url}")
         
         feed = self.fetch_feed(feed_url)
+        self._save_feed_cache()
+        return self.process_feed(feed_url, feed, limit)
+    
+    def process_feed(self, feed_url: str, feed: Optional[feedparser.FeedParserDict],
+                     limit: Optional[int] = None) -> Optional[Dict]:
+        """
+        Extract and store an already fetched feed
+        
+        Args:
+            feed_url: URL the feed was fetched from
+            feed: Parsed feed data (None if fetching failed)
+            limit: Maximum number of entries to extract
+            
+        Returns:
+            Dictionary with feed info and entries
+        """
         if not feed:
             return None
         
@@ -152,22 +374,53 @@ class RSSFeedScraper:
         """
         results = []
         
-        for url in feed_urls:
-            result = self.scrape_feed(url, limit)
-            if result:
-                results.append(result)
+        # feedparser is CPU-bound and holds the GIL, so fetch threads hand parsing to processes.
+        # Workers are started lazily while fetch threads hold locks, so spawn rather than fork them.
+        parse_workers = min(self.parse_workers, len(feed_urls))
+        if parse_workers > 1:
+            self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers,
+                                                   mp_context=multiprocessing.get_context('spawn'))
+        
+        try:
+            # Fetch all feeds concurrently; map() yields them back in input order
+            workers = max(1, min(self.max_workers, len(feed_urls)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for url, feed in zip(feed_urls, executor.map(self.fetch_feed, feed_urls)):
+                    print(f"Scraping feed: {url}")
+                    result = self.process_feed(url, feed, limit)
+                    if result:
+                        results.append(result)
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
         
+        self._save_feed_cache()
         return results
     
     def export_to_json(self, filename: str = "rss_data.json"):
         """Export scraped data to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.feeds_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(self.feeds_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    json.dump(self.feeds_data, f, indent=2, ensure_ascii=False)
             print(f"Data exported to {filename}")
         except Exception as e:
             print(f"Error exporting to JSON: {e}")
     
+    def _iter_rows(self, entry_keys: List[str]):
+        """Yield one flat CSV row tuple per entry, followed by its feed's name and URL"""
+        row = itemgetter(*entry_keys)
+        for feed_data in self.feeds_data:
+            feed_title = feed_data['feed_info']['title']
+            feed_url = feed_data['feed_url']
+            for entry in feed_data['entries']:
+                yield (*row(entry), feed_title, feed_url)
+    
     def export_to_csv(self, filename: str = "rss_data.csv"):
         """Export scraped entries to CSV file"""
         try:
@@ -175,26 +428,19 @@ class RSSFeedScraper:
                 print("No data to export")
                 return
             
-            # Flatten all entries from all feeds
-            all_entries = []
-            for feed_data in self.feeds_data:
-                feed_title = feed_data['feed_info']['title']
-                for entry in feed_data['entries']:
-                    entry_copy = entry.copy()
-                    entry_copy['feed_name'] = feed_title
-                    entry_copy['feed_url'] = feed_data['feed_url']
-                    all_entries.append(entry_copy)
-            
-            if not all_entries:
+            # The first entry supplies the column order for every row
+            first = next((entry for feed_data in self.feeds_data for entry in feed_data['entries']), None)
+            if first is None:
                 print("No entries to export")
                 return
+            entry_keys = list(first.keys())
             
-            # Write to CSV
-            keys = all_entries[0].keys()
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(all_entries)
+            # Write to CSV; plain writer fed tuples, built one at a time while writing
+            with open(filename, 'w', newline='', encoding='utf-8',
+                      buffering=self.WRITE_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(entry_keys + ['feed_name', 'feed_url'])
+                writer.writerows(self._iter_rows(entry_keys))
             
             print(f"Data exported to {filename}")
         except Exception as e:
@@ -206,9 +452,12 @@ class RSSFeedScraper:
             print("No feeds scraped yet")
             return
         
-        print("\n" + "="*60)
-        print("RSS FEED SCRAPING SUMMARY")
-        print("="*60)
+        lines = []
+        emit = lines.append
+        
+        emit("\n" + "="*60)
+        emit("RSS FEED SCRAPING SUMMARY")
+        emit("="*60)
         
         total_entries = 0
         for feed_data in self.feeds_data:
@@ -216,15 +465,17 @@ class RSSFeedScraper:
             num_entries = len(feed_data['entries'])
             total_entries += num_entries
             
-            print(f"\nFeed: {feed_info['title']}")
-            print(f"  URL: {feed_data['feed_url']}")
-            print(f"  Entries scraped: {num_entries}")
-            print(f"  Last updated: {feed_info['updated']}")
+            emit(f"\nFeed: {feed_info['title']}")
+            emit(f"  URL: {feed_data['feed_url']}")
+            emit(f"  Entries scraped: {num_entries}")
+            emit(f"  Last updated: {feed_info['updated']}")
+        
+        emit(f"\n{'='*60}")
+        emit(f"Total feeds scraped: {len(self.feeds_data)}")
+        emit(f"Total entries: {total_entries}")
+        emit(f"{'='*60}\n")
         
-        print(f"\n{'='*60}")
-        print(f"Total feeds scraped: {len(self.feeds_data)}")
-        print(f"Total entries: {total_entries}")
-        print(f"{'='*60}\n")
+        print('\n'.join(lines))
 
 
 def main():
@@ -255,6 +506,14 @@ Examples:
                        default='json', help='Output format (default: json)')
     parser.add_argument('--json-file', default='rss_data.json', help='JSON output filename')
     parser.add_argument('--csv-file', default='rss_data.csv', help='CSV output filename')
+    parser.add_argument('--concurrency', type=positive_int, default=32,
+                       help='Maximum feeds fetched at once (default: 32)')
+    parser.add_argument('--per-host', type=positive_int, default=8,
+                       help='Maximum simultaneous requests to one host (default: 8)')
+    parser.add_argument('--parse-workers', type=positive_int,
+                       help='Processes used to parse feeds (default: one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always re-download feeds instead of sending conditional GETs')
     
     args = parser.parse_args()
     
@@ -279,7 +538,9 @@ Examples:
         return
     
     # Create scraper and scrape feeds
-    scraper = RSSFeedScraper()
+    scraper = RSSFeedScraper(max_workers=args.concurrency, per_host=args.per_host,
+                             cache_dir=None if args.no_cache else '.rss_cache',
+                             parse_workers=args.parse_workers)
     scraper.scrape_multiple_feeds(feed_urls, limit=args.limit)
     
     # Display summary
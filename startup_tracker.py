@@ -8,10 +8,98 @@ import feedparser
 import requests
 import json
 import csv
+import hashlib
+import pickle
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import re
 from collections import Counter
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+try:
+    import ahocorasick  # optional C automaton for keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional Rust JSON serializer
+except ImportError:
+    orjson = None
+
+
+def build_keyword_automaton(categories: Dict[str, Dict], stages: Dict[str, List[str]],
+                            sectors: Dict[str, List[str]], investors: List[str]):
+    """
+    Compile category, stage, sector and investor keywords into one Aho-Corasick automaton
+    
+    Each lowercased keyword maps to the (kind, label) pairs it signals, e.g.
+    'series a' -> (('category', 'Funding'), ('stage', 'Series A')).
+    Returns None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    labels = {}
+    for category, info in categories.items():
+        for keyword in info['keywords']:
+            labels.setdefault(keyword, []).append(('category', category))
+    for stage, patterns in stages.items():
+        for pattern in patterns:
+            labels.setdefault(pattern, []).append(('stage', stage))
+    for sector, keywords in sectors.items():
+        for keyword in keywords:
+            labels.setdefault(keyword, []).append(('sector', sector))
+    for investor in investors:
+        labels.setdefault(investor.lower(), []).append(('investor', investor))
+    automaton = ahocorasick.Automaton()
+    for keyword, hits in labels.items():
+        automaton.add_word(keyword, tuple(hits))
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
+class Article:
+    """A scraped startup article; exported fields are declared in JSON/CSV column order"""
+    title: str
+    link: str
+    published_date: str
+    author: str
+    summary: str
+    feed_name: str
+    feed_url: str
+    
+    # Startup-specific fields
+    categories: str
+    primary_category: str
+    funding_stage: str
+    sectors: str
+    funding_amount: str
+    investors: str
+    
+    tags: str
+    relevance_score: int
+    is_startup_news: bool
+    
+    # Detected labels as lists, for the statistics; not exported
+    category_list: List[str] = field(default_factory=list, metadata={'export': False})
+    sector_list: List[str] = field(default_factory=list, metadata={'export': False})
+    investor_list: List[str] = field(default_factory=list, metadata={'export': False})
+    
+    def to_dict(self) -> Dict:
+        """Exported fields as a plain dict"""
+        return {name: getattr(self, name) for name in EXPORT_FIELDS}
+
+
+EXPORT_FIELDS = tuple(f.name for f in fields(Article) if f.metadata.get('export', True))
+
+
+def is_word_char(char: str) -> bool:
+    """Whether char is a regex \\w character"""
+    return char.isalnum() or char == '_'
 
 
 class StartupTracker:
@@ -138,98 +226,260 @@ class StartupTracker:
         '500 Startups', 'Techstars', 'Plug and Play'
     ]
     
-    def __init__(self, user_agent: str = "Startup-Tracker/1.0"):
+    # Categories flattened to (name, keywords, weight), plus each category's
+    # score points (20 * weight, kept as an int)
+    _CATEGORY_KEYWORDS = tuple((category, tuple(info['keywords']), info['weight'])
+                               for category, info in STARTUP_CATEGORIES.items())
+    _CATEGORY_POINTS = {category: round(20 * weight) for category, _, weight in _CATEGORY_KEYWORDS}
+    
+    # Funding amounts: "$X million/billion/M/B" anywhere wins, otherwise the first
+    # "X million/billion" without a dollar sign. One pattern finds both kinds.
+    _FUNDING_RE = re.compile(r'(?P<dollar>\$\s*)?(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>million|billion|M|B)',
+                             re.IGNORECASE)
+    
+    # Investor names as whole words, in one alternation (longest first, as a
+    # zero-width lookahead so overlapping names are all found). Each name is its own
+    # group, so m.lastindex maps a match back to it even when IGNORECASE matched a
+    # case-folded spelling ('ſequoia', 'Mıcrosoft Ventures').
+    _INVESTOR_ORDER = sorted(NOTABLE_INVESTORS, key=len, reverse=True)
+    _INVESTOR_RE = re.compile(
+        r'\b(?=(?:' + '|'.join('(' + re.escape(i) + ')' for i in _INVESTOR_ORDER) + r')\b)',
+        re.IGNORECASE)
+    
+    # All of the above in one automaton, so an article is scanned once
+    _KEYWORD_AUTOMATON = build_keyword_automaton(STARTUP_CATEGORIES, STARTUP_STAGES,
+                                                 TECH_SECTORS, NOTABLE_INVESTORS)
+    
+    # Sort key for ranking articles
+    _SCORE_KEY = attrgetter('relevance_score')
+    
+    # Export file buffer, so many small row writes turn into few large write() calls
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Parsed feeds kept on disk, keyed by a hash of the raw feed bytes
+    PARSE_CACHE_SIZE = 256
+    
+    def __init__(self, user_agent: str = "Startup-Tracker/1.0", max_workers: int = 32,
+                 cache_dir: Optional[str] = '.startup_cache'):
         self.user_agent = user_agent
-        self.all_articles = []
+        self.max_workers = max_workers
+        self.total_articles = 0
         self.startup_articles = []
+        self._aggregates = None
+        
+        # One keep-alive session shared by all fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Conditional GET cache: feed URL -> {'etag', 'modified', 'digest'}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.feed_cache = self._load_feed_cache()
+    
+    def _load_feed_cache(self) -> Dict:
+        """Load the ETag/Last-Modified index saved by the previous run"""
+        if not self.cache_dir:
+            return {}
+        try:
+            with open(self.cache_dir / 'index.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_feed_cache(self):
+        """Persist the ETag/Last-Modified index and evict least recently used parses"""
+        if not self.cache_dir:
+            return
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self.cache_dir / 'index.json', 'w', encoding='utf-8') as f:
+            json.dump(self.feed_cache, f, indent=2)
+        
+        parsed = sorted(self.cache_dir.glob('*.pickle'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in parsed[self.PARSE_CACHE_SIZE:]:
+            path.unlink(missing_ok=True)
+    
+    def _parsed_feed_path(self, digest: str) -> Path:
+        """Location of the pickled parse result for feed content with this digest"""
+        return self.cache_dir / f'{digest}.pickle'
+    
+    def _load_parsed_feed(self, digest: Optional[str]) -> Optional[feedparser.FeedParserDict]:
+        """Load a cached parse result, marking it as recently used"""
+        if not digest:
+            return None
+        path = self._parsed_feed_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                feed = pickle.load(f)
+        except OSError:
+            return None
+        except Exception:
+            # Truncated or stale pickle (e.g. written by another feedparser version); drop it and re-parse
+            path.unlink(missing_ok=True)
+            return None
+        path.touch()
+        return feed
+    
+    def parse_feed(self, content: bytes) -> feedparser.FeedParserDict:
+        """Parse raw feed bytes, sanitized but without rewriting relative links"""
+        # Resolving relative URIs re-parses every HTML field and roughly doubles parse
+        # time; it only changes anything for feeds that declare xml:base. Sanitizing
+        # stays on, since summaries are written into the HTML report as-is.
+        return feedparser.parse(content, resolve_relative_uris=False)
+    
+    def _parse_with_cache(self, content: bytes):
+        """Parse feed bytes, reusing the cached parse of byte-identical content"""
+        if not self.cache_dir:
+            return None, self.parse_feed(content)
+        
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        feed = self._load_parsed_feed(digest)
+        if feed is None:
+            feed = self.parse_feed(content)
+            if not self._store_parsed_feed(digest, feed):
+                return None, feed
+        return digest, feed
+    
+    def _store_parsed_feed(self, digest: str, feed: feedparser.FeedParserDict) -> bool:
+        """Pickle a parse result for reuse; returns False if it cannot be pickled"""
+        try:
+            data = pickle.dumps(feed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, ValueError, AttributeError):
+            # e.g. the SAXParseException feedparser attaches to malformed feeds
+            return False
+        self.cache_dir.mkdir(exist_ok=True)
+        with open(self._parsed_feed_path(digest), 'wb') as f:
+            f.write(data)
+        return True
     
     def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
-        """Fetch and parse an RSS feed"""
+        """Fetch and parse an RSS feed, skipping the download if it is unchanged"""
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=15)
+            cached = self.feed_cache.get(feed_url) if self.cache_dir else None
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('modified'):
+                    headers['If-Modified-Since'] = cached['modified']
+            
+            response = self.session.get(feed_url, headers=headers, timeout=15)
+            if response.status_code == 304:
+                feed = self._load_parsed_feed(cached.get('digest') if cached else None)
+                if feed is not None:
+                    return feed
+                # Cached copy is gone, fall back to a full download
+                response = self.session.get(feed_url, headers={'User-Agent': self.user_agent},
+                                            timeout=15)
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
+            digest, feed = self._parse_with_cache(response.content)
+            
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
+            if digest and (etag or modified):
+                self.feed_cache[feed_url] = {'etag': etag, 'modified': modified, 'digest': digest}
+            
             return feed
         except Exception as e:
             print(f"⚠️  Error fetching {feed_url}: {e}")
             return None
     
-    def detect_categories(self, text: str) -> List[str]:
-        """Detect startup event categories in text"""
-        text_lower = text.lower()
-        detected = []
+    def scan_keywords(self, text_lower: str) -> Dict[str, set]:
+        """
+        Find the categories, stages, sectors and investors in lowercased text
         
-        for category, info in self.STARTUP_CATEGORIES.items():
-            if any(keyword in text_lower for keyword in info['keywords']):
-                detected.append(category)
+        Returns:
+            {'category': {...}, 'stage': {...}, 'sector': {...}, 'investor': {...}}
+            sets of labels
+        """
+        hits = {'category': set(), 'stage': set(), 'sector': set(), 'investor': set()}
+        # Case-folded investor spellings are never ASCII and only the regex matches them
+        ascii_text = text_lower.isascii()
+        if self._KEYWORD_AUTOMATON is not None:
+            for end, labels in self._KEYWORD_AUTOMATON.iter(text_lower):
+                for kind, label in labels:
+                    if kind == 'investor':
+                        if not ascii_text:
+                            continue
+                        # Investors only count as whole words, like r'\bname\b'
+                        start = end - len(label) + 1
+                        if (start > 0 and is_word_char(text_lower[start - 1])) or \
+                           (end + 1 < len(text_lower) and is_word_char(text_lower[end + 1])):
+                            continue
+                    hits[kind].add(label)
+            if ascii_text:
+                return hits
+        else:
+            hits['category'] = {category for category, keywords, _ in self._CATEGORY_KEYWORDS
+                                if any(keyword in text_lower for keyword in keywords)}
+            hits['stage'] = {stage for stage, patterns in self.STARTUP_STAGES.items()
+                             if any(pattern in text_lower for pattern in patterns)}
+            hits['sector'] = {sector for sector, keywords in self.TECH_SECTORS.items()
+                              if any(keyword in text_lower for keyword in keywords)}
         
-        return detected
+        hits['investor'] = {self._INVESTOR_ORDER[m.lastindex - 1]
+                            for m in self._INVESTOR_RE.finditer(text_lower)}
+        return hits
+    
+    def detect_categories(self, text: str) -> List[str]:
+        """Detect startup event categories in text"""
+        category_hits = self.scan_keywords(text.lower())['category']
+        return [category for category in self.STARTUP_CATEGORIES if category in category_hits]
     
     def detect_stage(self, text: str) -> Optional[str]:
         """Detect startup funding stage"""
-        text_lower = text.lower()
-        
-        for stage, patterns in self.STARTUP_STAGES.items():
-            if any(pattern in text_lower for pattern in patterns):
-                return stage
-        
-        return None
+        stage_hits = self.scan_keywords(text.lower())['stage']
+        return next((stage for stage in self.STARTUP_STAGES if stage in stage_hits), None)
     
     def detect_sectors(self, text: str) -> List[str]:
         """Detect technology sectors"""
-        text_lower = text.lower()
-        detected = []
-        
-        for sector, keywords in self.TECH_SECTORS.items():
-            if any(keyword in text_lower for keyword in keywords):
-                detected.append(sector)
-        
-        return detected
+        sector_hits = self.scan_keywords(text.lower())['sector']
+        return [sector for sector in self.TECH_SECTORS if sector in sector_hits]
     
     def extract_funding_amount(self, text: str) -> Optional[str]:
         """Extract funding amount from text"""
-        # Pattern for $X million/billion
-        patterns = [
-            r'\$\s*(\d+(?:\.\d+)?)\s*(million|billion|M|B)',
-            r'(\d+(?:\.\d+)?)\s*(million|billion)\s*(?:dollars)?',
-            r'raised\s*\$\s*(\d+(?:\.\d+)?)\s*(million|billion|M|B)',
-            r'funding\s+of\s*\$\s*(\d+(?:\.\d+)?)\s*(million|billion|M|B)'
-        ]
+        match = None
+        for candidate in self._FUNDING_RE.finditer(text):
+            if candidate.group('dollar'):
+                match = candidate
+                break
+            if match is None and candidate.group('unit').lower() in ('million', 'billion'):
+                match = candidate
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = match.group(1)
-                unit = match.group(2).lower()
-                if unit in ['b', 'billion']:
-                    return f"${amount}B"
-                else:
-                    return f"${amount}M"
+        if match:
+            amount = match.group('amount')
+            unit = match.group('unit').lower()
+            if unit in ['b', 'billion']:
+                return f"${amount}B"
+            else:
+                return f"${amount}M"
         
         return None
     
     def extract_investors(self, text: str) -> List[str]:
         """Extract mentioned investors"""
-        found = []
-        for investor in self.NOTABLE_INVESTORS:
-            if re.search(r'\b' + re.escape(investor) + r'\b', text, re.IGNORECASE):
-                found.append(investor)
-        return found
-    
-    def calculate_relevance_score(self, entry: Dict) -> int:
-        """Calculate startup relevance score"""
+        investor_hits = self.scan_keywords(text.lower())['investor']
+        return [investor for investor in self.NOTABLE_INVESTORS if investor in investor_hits]
+    
+    def calculate_relevance_score(self, categories: List[str], sectors: List[str],
+                                  funding_amount: Optional[str], investors: List[str],
+                                  title_lower: str) -> int:
+        """
+        Calculate startup relevance score
+        
+        Args:
+            categories, sectors, funding_amount, investors: What extract_entry_data
+                detected in the article text
+            title_lower: Lowercased article title
+        """
         score = 0
-        text = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
         
         # Category detection with weighting
-        categories = self.detect_categories(text)
+        points = self._CATEGORY_POINTS
         for category in categories:
-            weight = self.STARTUP_CATEGORIES[category]['weight']
-            score += 20 * weight
+            score += points[category]
         
         # Funding amount bonus
-        funding_amount = self.extract_funding_amount(text)
         if funding_amount:
             score += 15
             # Extra bonus for large rounds
@@ -237,69 +487,82 @@ class StartupTracker:
                 score += 10
         
         # Notable investor bonus
-        investors = self.extract_investors(text)
         if investors:
             score += 10
         
         # Startup-specific keywords in title
         startup_keywords = ['startup', 'founder', 'raises', 'launches', 'acquires']
-        if any(kw in entry.get('title', '').lower() for kw in startup_keywords):
+        if any(kw in title_lower for kw in startup_keywords):
             score += 15
         
         # Sector detection
-        sectors = self.detect_sectors(text)
         if sectors:
             score += 5 * len(sectors)
         
-        return min(score, 100)
+        return 100 if score > 100 else score
     
-    def extract_entry_data(self, entry, feed_name: str, feed_url: str) -> Dict:
-        """Extract startup data from feed entry"""
-        # Get published date
-        published_date = 'Unknown'
+    def get_published_date(self, entry) -> Optional[datetime]:
+        """Published (or updated) date of a feed entry, if it has one"""
         if 'published_parsed' in entry and entry.published_parsed:
-            published_date = datetime(*entry.published_parsed[:6]).isoformat()
+            return datetime(*entry.published_parsed[:6])
         elif 'updated_parsed' in entry and entry.updated_parsed:
-            published_date = datetime(*entry.updated_parsed[:6]).isoformat()
+            return datetime(*entry.updated_parsed[:6])
+        return None
+    
+    def extract_entry_data(self, entry, feed_name: str, feed_url: str,
+                           published: Optional[datetime] = None) -> Article:
+        """Extract startup data from feed entry"""
+        if published is None:
+            published = self.get_published_date(entry)
+        
+        # Lowercase once; one keyword scan feeds the extracted fields and the score
+        title = entry.get('title', 'N/A')
+        summary = entry.get('summary', entry.get('description', 'N/A'))
+        title_lower = title.lower()
+        text_lower = f"{summary.lower()} {title_lower}"
+        hits = self.scan_keywords(text_lower)
         
         # Extract data
-        full_text = entry.get('summary', '') + ' ' + entry.get('title', '')
-        categories = self.detect_categories(full_text)
-        stage = self.detect_stage(full_text)
-        sectors = self.detect_sectors(full_text)
-        funding_amount = self.extract_funding_amount(full_text)
-        investors = self.extract_investors(full_text)
-        
-        entry_data = {
-            'title': entry.get('title', 'N/A'),
-            'link': entry.get('link', 'N/A'),
-            'published_date': published_date,
-            'author': entry.get('author', 'N/A'),
-            'summary': entry.get('summary', entry.get('description', 'N/A')),
-            'feed_name': feed_name,
-            'feed_url': feed_url,
-            
-            # Startup-specific fields
-            'categories': ', '.join(categories) if categories else 'General',
-            'primary_category': categories[0] if categories else 'General',
-            'funding_stage': stage if stage else 'N/A',
-            'sectors': ', '.join(sectors) if sectors else 'N/A',
-            'funding_amount': funding_amount if funding_amount else 'N/A',
-            'investors': ', '.join(investors) if investors else 'N/A',
-            
-            'tags': ', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A'
-        }
+        categories = [category for category in self.STARTUP_CATEGORIES if category in hits['category']]
+        stage = next((stage for stage in self.STARTUP_STAGES if stage in hits['stage']), None)
+        sectors = [sector for sector in self.TECH_SECTORS if sector in hits['sector']]
+        funding_amount = self.extract_funding_amount(text_lower)
+        investors = [investor for investor in self.NOTABLE_INVESTORS if investor in hits['investor']]
         
         # Calculate relevance
-        entry_data['relevance_score'] = self.calculate_relevance_score(entry_data)
-        entry_data['is_startup_news'] = entry_data['relevance_score'] >= 20
+        relevance_score = self.calculate_relevance_score(
+            categories, sectors, funding_amount, investors, title_lower)
         
-        return entry_data
+        return Article(
+            title=title,
+            link=entry.get('link', 'N/A'),
+            published_date=published.isoformat() if published else 'Unknown',
+            author=entry.get('author', 'N/A'),
+            summary=summary,
+            feed_name=feed_name,
+            feed_url=feed_url,
+            
+            # Startup-specific fields
+            categories=', '.join(categories) if categories else 'General',
+            primary_category=categories[0] if categories else 'General',
+            funding_stage=stage if stage else 'N/A',
+            sectors=', '.join(sectors) if sectors else 'N/A',
+            funding_amount=funding_amount if funding_amount else 'N/A',
+            investors=', '.join(investors) if investors else 'N/A',
+            
+            tags=', '.join([tag.term for tag in entry.get('tags', [])]) if entry.get('tags') else 'N/A',
+            relevance_score=relevance_score,
+            is_startup_news=relevance_score >= 20,
+            
+            category_list=categories,
+            sector_list=sectors,
+            investor_list=investors
+        )
     
     def scrape_startup_news(self, feed_urls: List[str], days_back: int = 7,
                            min_relevance_score: int = 20,
                            category_filter: Optional[str] = None,
-                           sector_filter: Optional[str] = None) -> List[Dict]:
+                           sector_filter: Optional[str] = None) -> List[Article]:
         """
         Scrape startup news from multiple feeds
         
@@ -321,49 +584,95 @@ class StartupTracker:
             print(f"🏷️  Sector filter: {sector_filter}")
         print()
         
-        for feed_url in feed_urls:
-            feed = self.fetch_feed(feed_url)
-            if not feed:
-                continue
-            
-            feed_name = feed.feed.get('title', 'Unknown Feed')
-            print(f"📰 Processing: {feed_name}")
-            
-            for entry in feed.entries:
-                entry_data = self.extract_entry_data(entry, feed_name, feed_url)
-                self.all_articles.append(entry_data)
-                
-                # Filter by date
-                if entry_data['published_date'] != 'Unknown':
-                    try:
-                        pub_date = datetime.fromisoformat(entry_data['published_date'])
-                        if pub_date < cutoff_date:
-                            continue
-                    except:
-                        pass
-                
-                # Filter by relevance
-                if entry_data['relevance_score'] < min_relevance_score:
+        # Links (or titles) already seen, so an article republished by
+        # several feeds is only scored and listed once
+        seen = set()
+        
+        # Fetch all feeds concurrently; map() yields them back in input order
+        workers = max(1, min(self.max_workers, len(feed_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for feed_url, feed in zip(feed_urls, executor.map(self.fetch_feed, feed_urls)):
+                if not feed:
                     continue
                 
-                # Filter by category
-                if category_filter:
-                    if category_filter.lower() not in entry_data['categories'].lower():
-                        continue
+                feed_name = feed.feed.get('title', 'Unknown Feed')
+                print(f"📰 Processing: {feed_name}")
                 
-                # Filter by sector
-                if sector_filter:
-                    if sector_filter.lower() not in entry_data['sectors'].lower():
+                for entry in feed.entries:
+                    self.total_articles += 1
+                    
+                    # Filter by date before any text scanning
+                    published = self.get_published_date(entry)
+                    if published and published < cutoff_date:
                         continue
-                
-                self.startup_articles.append(entry_data)
+                    
+                    # Skip duplicates of an article already processed
+                    key = entry.get('link') or entry.get('title')
+                    if key:
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    
+                    entry_data = self.extract_entry_data(entry, feed_name, feed_url, published)
+                    
+                    # Filter by relevance
+                    if entry_data.relevance_score < min_relevance_score:
+                        continue
+                    
+                    # Filter by category
+                    if category_filter:
+                        if category_filter.lower() not in entry_data.categories.lower():
+                            continue
+                    
+                    # Filter by sector
+                    if sector_filter:
+                        if sector_filter.lower() not in entry_data.sectors.lower():
+                            continue
+                    
+                    self.startup_articles.append(entry_data)
+        
+        self._save_feed_cache()
         
         # Sort by relevance score
-        self.startup_articles.sort(key=lambda x: x['relevance_score'], reverse=True)
+        self.startup_articles.sort(key=self._SCORE_KEY, reverse=True)
+        # The list was extended in place, so cached counts are stale
+        self._aggregates = None
         
-        print(f"\n✅ Found {len(self.startup_articles)} startup articles (out of {len(self.all_articles)} total)")
+        print(f"\n✅ Found {len(self.startup_articles)} startup articles (out of {self.total_articles} total)")
         return self.startup_articles
     
+    def _compute_aggregates(self) -> Dict[str, Counter]:
+        """Count categories, stages, sectors, investors and sources in one pass"""
+        # Cached per article list, so a later reassignment recounts
+        if self._aggregates is not None and self._aggregates[0] is self.startup_articles:
+            return self._aggregates[1]
+        
+        category_counts = Counter()
+        primary_counts = Counter()
+        stage_counts = Counter()
+        sector_counts = Counter()
+        investor_counts = Counter()
+        feed_counts = Counter()
+        for article in self.startup_articles:
+            category_counts.update(article.category_list)
+            primary_counts[article.primary_category] += 1
+            if article.funding_stage != 'N/A':
+                stage_counts[article.funding_stage] += 1
+            sector_counts.update(article.sector_list)
+            investor_counts.update(article.investor_list)
+            feed_counts[article.feed_name] += 1
+        
+        aggregates = {
+            'categories': category_counts,
+            'primary_categories': primary_counts,
+            'stages': stage_counts,
+            'sectors': sector_counts,
+            'investors': investor_counts,
+            'feeds': feed_counts
+        }
+        self._aggregates = (self.startup_articles, aggregates)
+        return aggregates
+    
     def display_summary(self):
         """Display summary of startup news"""
         if not self.startup_articles:
@@ -387,21 +696,21 @@ class StartupTracker:
                 'Expansion': '🌍',
                 'Pivot': '🔄',
                 'Shutdown': '⚠️'
-            }.get(article['primary_category'], '📰')
+            }.get(article.primary_category, '📰')
             
-            print(f"{i}. {cat_emoji} [{article['relevance_score']}/100] {article['title']}")
-            print(f"   📂 {article['primary_category']} | 📅 {article['published_date'][:10]}")
-            print(f"   📰 {article['feed_name']}")
-            print(f"   🔗 {article['link']}")
+            print(f"{i}. {cat_emoji} [{article.relevance_score}/100] {article.title}")
+            print(f"   📂 {article.primary_category} | 📅 {article.published_date[:10]}")
+            print(f"   📰 {article.feed_name}")
+            print(f"   🔗 {article.link}")
             
-            if article['funding_amount'] != 'N/A':
-                print(f"   💵 Amount: {article['funding_amount']}")
-            if article['funding_stage'] != 'N/A':
-                print(f"   📊 Stage: {article['funding_stage']}")
-            if article['sectors'] != 'N/A':
-                print(f"   🏷️  Sectors: {article['sectors']}")
-            if article['investors'] != 'N/A':
-                print(f"   🏦 Investors: {article['investors']}")
+            if article.funding_amount != 'N/A':
+                print(f"   💵 Amount: {article.funding_amount}")
+            if article.funding_stage != 'N/A':
+                print(f"   📊 Stage: {article.funding_stage}")
+            if article.sectors != 'N/A':
+                print(f"   🏷️  Sectors: {article.sectors}")
+            if article.investors != 'N/A':
+                print(f"   🏦 Investors: {article.investors}")
             print()
         
         # Statistics
@@ -409,16 +718,11 @@ class StartupTracker:
         print("📈 STARTUP ECOSYSTEM STATISTICS")
         print("="*80)
         
-        # Category breakdown
-        category_counts = Counter()
-        for article in self.startup_articles:
-            cats = article['categories'].split(', ')
-            for cat in cats:
-                if cat != 'General':
-                    category_counts[cat] += 1
+        aggregates = self._compute_aggregates()
         
+        # Category breakdown
         print("\n📂 Articles by Category:")
-        for category, count in category_counts.most_common():
+        for category, count in aggregates['categories'].most_common():
             percentage = (count / len(self.startup_articles)) * 100
             emoji = {
                 'Funding': '💰',
@@ -433,24 +737,14 @@ class StartupTracker:
             print(f"   {emoji} {category}: {count} articles ({percentage:.1f}%)")
         
         # Funding stage breakdown
-        stage_counts = Counter(
-            article['funding_stage'] for article in self.startup_articles
-            if article['funding_stage'] != 'N/A'
-        )
-        
+        stage_counts = aggregates['stages']
         if stage_counts:
             print("\n📊 Funding by Stage:")
             for stage, count in stage_counts.most_common():
                 print(f"   {stage}: {count} articles")
         
         # Sector breakdown
-        sector_counts = Counter()
-        for article in self.startup_articles:
-            if article['sectors'] != 'N/A':
-                sectors = article['sectors'].split(', ')
-                for sector in sectors:
-                    sector_counts[sector] += 1
-        
+        sector_counts = aggregates['sectors']
         if sector_counts:
             print("\n🏷️  Top Sectors:")
             for sector, count in sector_counts.most_common(10):
@@ -458,35 +752,29 @@ class StartupTracker:
                 print(f"   {sector}: {count} articles ({percentage:.1f}%)")
         
         # Investor mentions
-        all_investors = []
-        for article in self.startup_articles:
-            if article['investors'] != 'N/A':
-                all_investors.extend(article['investors'].split(', '))
-        
-        if all_investors:
-            investor_counts = Counter(all_investors)
+        investor_counts = aggregates['investors']
+        if investor_counts:
             print("\n🏦 Most Active Investors:")
             for investor, count in investor_counts.most_common(10):
                 print(f"   {investor}: {count} mentions")
         
         # Funding amounts
-        funding_articles = [a for a in self.startup_articles if a['funding_amount'] != 'N/A']
+        funding_articles = [a for a in self.startup_articles if a.funding_amount != 'N/A']
         if funding_articles:
             print(f"\n💵 Funding Announcements: {len(funding_articles)} articles")
             print("   Top 5 by amount:")
             sorted_funding = sorted(funding_articles, 
                                    key=lambda x: (
-                                       float(x['funding_amount'].replace('$', '').replace('B', '').replace('M', '')) * 
-                                       (1000 if 'B' in x['funding_amount'] else 1)
+                                       float(x.funding_amount.replace('$', '').replace('B', '').replace('M', '')) * 
+                                       (1000 if 'B' in x.funding_amount else 1)
                                    ), 
                                    reverse=True)
             for article in sorted_funding[:5]:
-                print(f"   💰 {article['funding_amount']}: {article['title'][:60]}...")
+                print(f"   💰 {article.funding_amount}: {article.title[:60]}...")
         
         # Source statistics
-        feed_counts = Counter(article['feed_name'] for article in self.startup_articles)
         print("\n📰 Top Sources:")
-        for feed, count in feed_counts.most_common(10):
+        for feed, count in aggregates['feeds'].most_common(10):
             print(f"   {feed}: {count} articles")
         
         print("\n" + "="*80 + "\n")
@@ -498,11 +786,16 @@ class StartupTracker:
             'total_articles': len(self.startup_articles),
             'categories_tracked': list(self.STARTUP_CATEGORIES.keys()),
             'sectors_tracked': list(self.TECH_SECTORS.keys()),
-            'articles': self.startup_articles
+            'articles': [article.to_dict() for article in self.startup_articles]
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"📄 Exported {len(self.startup_articles)} articles to {filename}")
     
     def export_to_csv(self, filename: str = "startup_news.csv"):
@@ -511,25 +804,30 @@ class StartupTracker:
             print("No articles to export")
             return
         
-        keys = self.startup_articles[0].keys()
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(self.startup_articles)
+        row = attrgetter(*EXPORT_FIELDS)
+        with open(filename, 'w', newline='', encoding='utf-8',
+                  buffering=self.WRITE_BUFFER_SIZE) as f:
+            # Plain writer fed tuples, built one at a time while writing
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            writer.writerows(map(row, self.startup_articles))
         
         print(f"📊 Exported {len(self.startup_articles)} articles to {filename}")
     
     def export_html_report(self, filename: str = "startup_news_report.html"):
         """Generate HTML report"""
         
-        # Calculate category distribution
-        category_counts = Counter(article['primary_category'] for article in self.startup_articles)
+        # Category distribution
+        category_counts = self._compute_aggregates()['primary_categories']
+        generated = datetime.now()
         
-        html = f"""<!DOCTYPE html>
+        # Write straight to the file instead of growing one big string
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>Startup Ecosystem Report - {datetime.now().strftime('%Y-%m-%d')}</title>
+    <title>Startup Ecosystem Report - {generated.strftime('%Y-%m-%d')}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
@@ -652,7 +950,7 @@ class StartupTracker:
 <body>
     <div class="container">
         <h1>🚀 Startup Ecosystem Report</h1>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p><strong>Generated:</strong> {generated.strftime('%Y-%m-%d %H:%M:%S')}</p>
         
         <div class="stats">
             <div class="stat-box">
@@ -674,65 +972,62 @@ class StartupTracker:
         </div>
         
         <h2 style="color: #667eea; margin-top: 40px;">📰 Latest Startup News</h2>
-"""
-        
-        for article in self.startup_articles[:50]:
-            # Determine article class and emoji
-            cat_lower = article['primary_category'].lower().replace('/', '').replace(' ', '')
-            article_class = ''
-            emoji = '📰'
-            
-            if 'funding' in cat_lower:
-                article_class = 'funding'
-                emoji = '💰'
-            elif 'acquisition' in cat_lower:
-                article_class = 'acquisition'
-                emoji = '🤝'
-            elif 'launch' in cat_lower:
-                article_class = 'launch'
-                emoji = '🚀'
-            elif 'ipo' in cat_lower or 'public' in cat_lower:
-                article_class = 'ipo'
-                emoji = '📈'
+""")
             
-            html += f"""
+            for article in self.startup_articles[:50]:
+                # Determine article class and emoji
+                cat_lower = article.primary_category.lower().replace('/', '').replace(' ', '')
+                article_class = ''
+                emoji = '📰'
+                
+                if 'funding' in cat_lower:
+                    article_class = 'funding'
+                    emoji = '💰'
+                elif 'acquisition' in cat_lower:
+                    article_class = 'acquisition'
+                    emoji = '🤝'
+                elif 'launch' in cat_lower:
+                    article_class = 'launch'
+                    emoji = '🚀'
+                elif 'ipo' in cat_lower or 'public' in cat_lower:
+                    article_class = 'ipo'
+                    emoji = '📈'
+                
+                f.write(f"""
         <div class="article {article_class}">
-            <h2>{emoji} <a href="{article['link']}" target="_blank">{article['title']}</a></h2>
+            <h2>{emoji} <a href="{article.link}" target="_blank">{article.title}</a></h2>
             <div class="meta">
-                <span class="badge score">Score: {article['relevance_score']}/100</span>
-                <span class="badge {article_class}">{article['primary_category']}</span>
-                📅 {article['published_date'][:10]} | 📰 {article['feed_name']}
+                <span class="badge score">Score: {article.relevance_score}/100</span>
+                <span class="badge {article_class}">{article.primary_category}</span>
+                📅 {article.published_date[:10]} | 📰 {article.feed_name}
             </div>
-"""
-            
-            # Add info boxes for funding, stage, sectors, investors
-            if article['funding_amount'] != 'N/A' or article['funding_stage'] != 'N/A' or \
-               article['sectors'] != 'N/A' or article['investors'] != 'N/A':
-                html += '            <div class="info-box">\n'
+""")
                 
-                if article['funding_amount'] != 'N/A':
-                    html += f"                💵 <strong>Amount:</strong> {article['funding_amount']}<br>\n"
-                if article['funding_stage'] != 'N/A':
-                    html += f"                📊 <strong>Stage:</strong> {article['funding_stage']}<br>\n"
-                if article['sectors'] != 'N/A':
-                    html += f"                🏷️ <strong>Sectors:</strong> {article['sectors']}<br>\n"
-                if article['investors'] != 'N/A':
-                    html += f"                🏦 <strong>Investors:</strong> {article['investors']}\n"
+                # Add info boxes for funding, stage, sectors, investors
+                if article.funding_amount != 'N/A' or article.funding_stage != 'N/A' or \
+                   article.sectors != 'N/A' or article.investors != 'N/A':
+                    f.write('            <div class="info-box">\n')
+                    
+                    if article.funding_amount != 'N/A':
+                        f.write(f"                💵 <strong>Amount:</strong> {article.funding_amount}<br>\n")
+                    if article.funding_stage != 'N/A':
+                        f.write(f"                📊 <strong>Stage:</strong> {article.funding_stage}<br>\n")
+                    if article.sectors != 'N/A':
+                        f.write(f"                🏷️ <strong>Sectors:</strong> {article.sectors}<br>\n")
+                    if article.investors != 'N/A':
+                        f.write(f"                🏦 <strong>Investors:</strong> {article.investors}\n")
+                    
+                    f.write('            </div>\n')
                 
-                html += '            </div>\n'
-            
-            html += f"""            <div class="summary">{article['summary'][:500]}{'...' if len(article['summary']) > 500 else ''}</div>
+                f.write(f"""            <div class="summary">{article.summary[:500]}{'...' if len(article.summary) > 500 else ''}</div>
         </div>
-"""
-        
-        html += """
+""")
+            
+            f.write("""
     </div>
 </body>
 </html>
-"""
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+""")
         
         print(f"📱 Generated HTML report: {filename}")
 
@@ -756,6 +1051,8 @@ def main():
                        help='Filter by sector (AI/ML, FinTech, HealthTech, etc.)')
     parser.add_argument('-o', '--output', choices=['json', 'csv', 'html', 'all'],
                        default='all', help='Output format')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always re-download feeds instead of sending conditional GETs')
     
     args = parser.parse_args()
     
@@ -773,7 +1070,7 @@ def main():
         return
     
     # Create tracker and scrape
-    tracker = StartupTracker()
+    tracker = StartupTracker(cache_dir=None if args.no_cache else '.startup_cache')
     tracker.scrape_startup_news(feed_urls, days_back=args.days, 
                                min_relevance_score=args.score,
                                category_filter=args.category,